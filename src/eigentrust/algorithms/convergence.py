@@ -3,6 +3,7 @@
 Provides functions to check if trust scores have converged.
 """
 
+import functools
 from typing import NamedTuple
 
 import torch
@@ -20,6 +21,21 @@ class ConvergenceStatus(NamedTuple):
     delta: float
 
 
+@functools.lru_cache(maxsize=8)
+def _scratch_buffers(
+    size: int, dtype: torch.dtype, device: torch.device
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """Get reusable (difference, scalar result) buffers for a vector shape.
+
+    check_convergence runs once per power iteration, so its intermediates
+    are reused across calls instead of being reallocated. Keyed by
+    size/dtype/device so mismatched inputs never share a buffer.
+    """
+    diff = torch.empty(size, dtype=dtype, device=device)
+    scalar = torch.empty((), dtype=dtype, device=device)
+    return diff, scalar
+
+
 def check_convergence(
     t_old: torch.Tensor, t_new: torch.Tensor, epsilon: float, norm_type: str = "l1"
 ) -> ConvergenceStatus:
@@ -51,17 +67,16 @@ def check_convergence(
     if t_old.shape != t_new.shape:
         raise ValueError(f"Trust vectors must have same size: {t_old.shape} vs {t_new.shape}")
 
-    # Compute difference vector
-    diff = t_new - t_old
-
-    # Compute norm based on type
-    if norm_type == "l1":
-        delta = torch.norm(diff, p=1).item()
-    elif norm_type == "l2":
-        delta = torch.norm(diff, p=2).item()
-    else:
+    if norm_type not in ("l1", "l2"):
         raise ValueError(f"Invalid norm type: {norm_type}. Use 'l1' or 'l2'")
 
+    # Compute the difference and its norm into cached buffers: same FLOPs,
+    # but no fresh intermediate tensors on this once-per-iteration path
+    diff, scalar = _scratch_buffers(t_new.numel(), t_new.dtype, t_new.device)
+    torch.sub(t_new, t_old, out=diff)
+    torch.linalg.vector_norm(diff, ord=1 if norm_type == "l1" else 2, out=scalar)
+    delta = scalar.item()
+
     # Check convergence
     converged = delta < epsilon
 
@@ -3,12 +3,56 @@
 Computes global trust scores using power iteration method.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 
+import numpy as np
 import torch
 
 from eigentrust.algorithms.convergence import check_convergence
 
+# Below this size, ATen dispatch overhead per iteration outweighs the
+# actual FLOPs and the NumPy loop in _power_iterate_small wins
+_SMALL_N_THRESHOLD = 64
+
+
+def _power_iterate_small(
+    matrix_t: np.ndarray,
+    pre_trust: np.ndarray,
+    max_iterations: int,
+    epsilon: float,
+    norm_ord: int,
+    alpha: float,
+) -> tuple[np.ndarray, int, bool]:
+    """Run the damped power iteration on NumPy arrays for small matrices.
+
+    Semantically identical to the torch loop in compute_eigentrust but
+    without per-iteration tensor dispatch, which dominates runtime for
+    the small (n ≤ 64) networks this demo typically simulates.
+
+    Args:
+        matrix_t: Transposed column-stochastic trust matrix (N×N)
+        pre_trust: Normalized pre-trust vector (N,)
+        max_iterations: Maximum number of iterations
+        epsilon: Convergence threshold
+        norm_ord: Norm order for the convergence delta (1 or 2)
+        alpha: Damping factor in [0, 1]
+
+    Returns:
+        Tuple of (global_trust, iterations, converged)
+    """
+    t = pre_trust.copy()
+    for iteration in range(max_iterations):
+        t_new = (1.0 - alpha) * (matrix_t @ t) + alpha * pre_trust
+        t_new /= t_new.sum()
+
+        delta = np.linalg.norm(t_new - t, ord=norm_ord)
+        if delta < epsilon:
+            return t_new, iteration + 1, True
+
+        t = t_new
+
+    return t, max_iterations, False
+
 
 def compute_eigentrust(
     trust_matrix: torch.Tensor,
@@ -68,10 +112,25 @@ def compute_eigentrust(
             f"Pre-trust vector size ({pre_trust.shape[0]}) must match matrix size ({n})"
         )
 
+    if norm_type not in ("l1", "l2"):
+        raise ValueError(f"Invalid norm type: {norm_type}. Use 'l1' or 'l2'")
+
     # Ensure pre-trust sums to 1.0
     if not torch.allclose(pre_trust.sum(), torch.tensor(1.0), atol=1e-6):
         pre_trust = pre_trust / pre_trust.sum()
 
+    # Small matrices iterate in NumPy; tensor I/O stays at the boundary
+    if n <= _SMALL_N_THRESHOLD:
+        t_np, iterations, converged = _power_iterate_small(
+            np.ascontiguousarray(trust_matrix.T.detach().cpu().numpy()),
+            pre_trust.detach().cpu().numpy(),
+            max_iterations,
+            epsilon,
+            1 if norm_type == "l1" else 2,
+            alpha,
+        )
+        return torch.from_numpy(t_np), iterations, converged
+
     # Initialize trust vector
     t = pre_trust.clone()
 
@@ -142,20 +201,18 @@ def compute_eigentrust_with_history(
     if not torch.allclose(pre_trust.sum(), torch.tensor(1.0), atol=1e-6):
         pre_trust = pre_trust / pre_trust.sum()
 
-    # Initialize trust vector and history
+    # Initialize trust vector; snapshots land in a preallocated buffer
+    # (one bulk row copy per iteration) instead of a per-iteration dict,
+    # which keeps Python allocation out of the power-iteration loop
     t = pre_trust.clone()
-    history = []
+    history_buf = torch.empty((max_iterations + 1, n), dtype=t.dtype, device=t.device)
+    deltas = [1.0]  # Initial delta is large
+    timestamps = [datetime.now(timezone.utc).isoformat()]
+    history_buf[0].copy_(t)
+    rows = 1
 
-    # Record initial state (iteration 0)
-    trust_scores_dict = {peer_ids[i]: float(t[i].item()) for i in range(n)}
-    history.append(
-        {
-            "iteration": 0,
-            "trust_scores": trust_scores_dict,
-            "delta": 1.0,  # Initial delta is large
-            "timestamp": datetime.utcnow().isoformat(),
-        }
-    )
+    iterations = max_iterations
+    converged = False
 
     # Power iteration with damping
     for iteration in range(max_iterations):
@@ -171,21 +228,45 @@ def compute_eigentrust_with_history(
         status = check_convergence(t, t_new, epsilon, norm_type=norm_type)
 
         # Record this iteration
-        trust_scores_dict = {peer_ids[i]: float(t_new[i].item()) for i in range(n)}
-        history.append(
-            {
-                "iteration": iteration + 1,
-                "trust_scores": trust_scores_dict,
-                "delta": status.delta,
-                "timestamp": datetime.utcnow().isoformat(),
-            }
-        )
+        history_buf[rows].copy_(t_new)
+        deltas.append(status.delta)
+        timestamps.append(datetime.now(timezone.utc).isoformat())
+        rows += 1
 
+        t = t_new
         if status.converged:
-            return t_new, iteration + 1, True, history
+            iterations = iteration + 1
+            converged = True
+            break
 
-        # Update for next iteration
-        t = t_new
+    return t, iterations, converged, _materialize_history(
+        history_buf[:rows], deltas, timestamps, peer_ids
+    )
 
-    # Max iterations reached without convergence
-    return t, max_iterations, False, history
+
+def _materialize_history(
+    history_buf: torch.Tensor, deltas: list[float], timestamps: list[str], peer_ids: list[str]
+) -> list[dict]:
+    """Build per-iteration snapshot dicts from the recorded score buffer.
+
+    Runs once after the iteration loop, converting the whole buffer with
+    a single .tolist() call rather than n .item() round-trips per row.
+
+    Args:
+        history_buf: (iterations+1, N) tensor of trust scores per iteration
+        deltas: Convergence delta per recorded row
+        timestamps: ISO timestamp captured when each row was recorded
+        peer_ids: Peer IDs corresponding to buffer columns
+
+    Returns:
+        List of ConvergenceSnapshot dicts per iteration
+    """
+    return [
+        {
+            "iteration": k,
+            "trust_scores": dict(zip(peer_ids, row)),
+            "delta": deltas[k],
+            "timestamp": timestamps[k],
+        }
+        for k, row in enumerate(history_buf.tolist())
+    ]
@@ -34,12 +34,11 @@ def normalize_columns(matrix: torch.Tensor) -> torch.Tensor:
     # Compute column sums
     column_sums = matrix.sum(dim=0)
 
-    # Handle zero columns (peers with no incoming trust)
-    # Replace zeros with 1.0 to avoid division by zero
-    # Zero columns will remain zero after normalization
-    column_sums = torch.where(column_sums == 0, torch.ones_like(column_sums), column_sums)
-
-    # Normalize: divide each column by its sum
-    normalized = matrix / column_sums.unsqueeze(0)
-
-    return normalized
+    # Handle zero columns (peers with no incoming trust) branchlessly:
+    # clamp sums to the smallest positive float in place, so 0/tiny = 0
+    # and zero columns stay zero without a masking pass
+    column_sums.clamp_(min=torch.finfo(matrix.dtype).tiny)
+
+    # Normalize: divide each column by its sum (broadcast over rows).
+    # Kept out-of-place: callers hold references to the input matrix.
+    return matrix / column_sums
@@ -200,9 +200,10 @@ def run(
 
         # Show top trust scores
         typer.echo("\nTop Trust Scores:")
+        peer_by_id = {p.peer_id: p for p in sim.peers}
         sorted_scores = sorted(trust_scores.scores.items(), key=lambda x: x[1], reverse=True)
         for i, (peer_id, score) in enumerate(sorted_scores[:5], 1):
-            peer = next(p for p in sim.peers if p.peer_id == peer_id)
+            peer = peer_by_id[peer_id]
             typer.echo(
                 f"  {i}. {peer.display_name}: {score:.4f} "
                 f"[comp={peer.competence:.2f}, mal={peer.maliciousness:.2f}]"
@@ -291,7 +292,7 @@ def visualize_matrix(
     dpi: Annotated[
         int,
         typer.Option(help="Resolution (DPI) for output image"),
-    ] = 300,
+    ] = 150,
     annotate: Annotated[
         bool | None,
         typer.Option(help="Force show/hide cell annotations (auto if not specified)"),
@@ -360,7 +361,7 @@ def visualize_graph(
     dpi: Annotated[
         int,
         typer.Option(help="Resolution (DPI) for output image"),
-    ] = 300,
+    ] = 150,
     show_labels: Annotated[
         bool,
         typer.Option(help="Show peer names as labels"),
@@ -423,7 +424,7 @@ def visualize_convergence(
     dpi: Annotated[
         int,
         typer.Option(help="Resolution (DPI) for output image"),
-    ] = 300,
+    ] = 150,
     verbose: Annotated[
         bool,
         typer.Option(help="Enable verbose logging"),
@@ -550,29 +551,35 @@ def all(
         # Step 4: Generate visualizations
         typer.echo("\n[4/5] Generating visualizations...")
 
-        # Matrix visualization
-        from eigentrust.visualization.matrix_viz import MatrixVisualizer
-
-        matrix_viz = MatrixVisualizer()
-        matrix_file = output_dir / "trust_matrix.png"
-        matrix_viz.visualize(sim, matrix_file)
-        typer.echo(f"  ✓ Trust matrix: {matrix_file}")
+        from concurrent.futures import ThreadPoolExecutor
 
-        # Graph visualization
+        from eigentrust.visualization.formatters import ConvergencePlotter
         from eigentrust.visualization.graph_viz import GraphVisualizer
+        from eigentrust.visualization.matrix_viz import MatrixVisualizer
 
-        graph_viz = GraphVisualizer()
-        graph_file = output_dir / "trust_graph.png"
-        graph_viz.visualize(sim, graph_file)
-        typer.echo(f"  ✓ Trust graph: {graph_file}")
-
-        # Convergence visualization
-        from eigentrust.visualization.formatters import ConvergencePlotter
+        # Build the trust matrix once up front so the worker threads share
+        # the memoized result instead of racing to construct it
+        sim._build_trust_matrix()
 
-        conv_plotter = ConvergencePlotter()
+        matrix_file = output_dir / "trust_matrix.png"
+        graph_file = output_dir / "trust_graph.png"
         conv_file = output_dir / "convergence.png"
-        conv_plotter.visualize(sim, conv_file)
-        typer.echo(f"  ✓ Convergence plot: {conv_file}")
+
+        # The three visualizations are independent and each dominated by
+        # draw + PNG encode (which release the GIL), so run them in parallel
+        tasks = [
+            ("Trust matrix", MatrixVisualizer(), matrix_file),
+            ("Trust graph", GraphVisualizer(), graph_file),
+            ("Convergence plot", ConvergencePlotter(), conv_file),
+        ]
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                (label, path, executor.submit(viz.visualize, sim, path))
+                for label, viz, path in tasks
+            ]
+            for label, path, future in futures:
+                future.result()
+                typer.echo(f"  ✓ {label}: {path}")
 
         # Step 5: Summary
         typer.echo("\n[5/5] Summary")
@@ -583,9 +590,10 @@ def all(
 
         # Show top trust scores
         typer.echo("\n  Top 5 Trust Scores:")
+        peer_by_id = {p.peer_id: p for p in sim.peers}
         sorted_scores = sorted(trust_scores.scores.items(), key=lambda x: x[1], reverse=True)
         for i, (peer_id, score) in enumerate(sorted_scores[:5], 1):
-            peer = next(p for p in sim.peers if p.peer_id == peer_id)
+            peer = peer_by_id[peer_id]
             typer.echo(
                 f"    {i}. {peer.display_name}: {score:.4f} "
                 f"[comp={peer.competence:.2f}, mal={peer.maliciousness:.2f}]"
@@ -6,6 +6,8 @@ including custom exceptions for handling domain-specific errors.
 
 from datetime import datetime
 
+import torch
+
 # Value Objects
 
 
@@ -68,11 +70,27 @@ class TrustScores:
         object.__setattr__(self, "convergence_epsilon", convergence_epsilon)
         object.__setattr__(self, "final_delta", final_delta)
         object.__setattr__(self, "history", history.copy() if history else [])
+        object.__setattr__(self, "_scores_tensor", None)
 
     def __setattr__(self, name, value):
         """Prevent modification of attributes (immutability)."""
         raise AttributeError("Cannot modify immutable TrustScores object")
 
+    @property
+    def scores_tensor(self) -> torch.Tensor:
+        """Scores as a tensor (order matches iteration over scores).
+
+        Built lazily and cached, so aggregate checks like sums run as a
+        single C-level reduction instead of a Python dict traversal.
+        """
+        if self._scores_tensor is None:
+            object.__setattr__(
+                self,
+                "_scores_tensor",
+                torch.tensor(list(self.scores.values()), dtype=torch.float32),
+            )
+        return self._scores_tensor
+
     def get_score(self, peer_id: str) -> float:
         """Get trust score for a specific peer.
 
@@ -3,6 +3,7 @@
 Defines interaction outcomes and interaction records between peers.
 """
 
+import time
 import uuid
 from datetime import datetime
 from enum import Enum
@@ -28,6 +29,10 @@ class Interaction:
         timestamp: When the interaction occurred
     """
 
+    # Interactions are created in bulk during simulation, so drop the
+    # per-instance __dict__ and defer datetime construction until asked
+    __slots__ = ("interaction_id", "source_peer_id", "target_peer_id", "outcome", "_timestamp")
+
     def __init__(
         self,
         source_peer_id: str,
@@ -59,14 +64,34 @@ class Interaction:
         object.__setattr__(self, "source_peer_id", source_peer_id)
         object.__setattr__(self, "target_peer_id", target_peer_id)
         object.__setattr__(self, "outcome", outcome)
+        # Record the wall clock as raw nanoseconds; the datetime object is
+        # only materialized if the timestamp is actually read
         object.__setattr__(
-            self, "timestamp", timestamp if timestamp is not None else datetime.utcnow()
+            self, "_timestamp", timestamp if timestamp is not None else time.time_ns()
         )
 
     def __setattr__(self, name, value):
         """Prevent modification of attributes (immutability)."""
         raise AttributeError("Cannot modify immutable Interaction object")
 
+    def __getstate__(self) -> tuple:
+        """Capture slot values for pickling (slotted classes have no __dict__)."""
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        """Restore slot values, bypassing the immutability guard."""
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+    @property
+    def timestamp(self) -> datetime:
+        """When the interaction occurred (materialized lazily)."""
+        ts = self._timestamp
+        if isinstance(ts, int):
+            ts = datetime.utcfromtimestamp(ts / 1e9)
+            object.__setattr__(self, "_timestamp", ts)
+        return ts
+
     def to_dict(self) -> dict:
         """Convert interaction to dictionary for serialization."""
         return {
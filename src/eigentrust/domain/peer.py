@@ -3,10 +3,16 @@
 Represents an individual node in the peer-to-peer network with behavioral characteristics.
 """
 
+import itertools
 import uuid
 
 from eigentrust.domain import InvalidPeerCharacteristics
 
+# Process-wide counter for auto-generated display names; formatting a
+# short integer is far cheaper than deriving a name from the UUID and
+# guarantees uniqueness within a process
+_peer_counter = itertools.count()
+
 
 class Peer:
     """Entity representing a peer in the trust network.
@@ -26,6 +32,7 @@ class Peer:
         maliciousness: float,
         peer_id: str | None = None,
         display_name: str | None = None,
+        index: int | None = None,
     ):
         """Initialize a new peer with characteristics.
 
@@ -34,6 +41,8 @@ class Peer:
             maliciousness: Malicious intent [0.0, 1.0]
             peer_id: Optional peer ID (auto-generated if not provided)
             display_name: Optional display name (auto-generated if not provided)
+            index: Optional position in the owning network; used for the
+                auto-generated display name when given
 
         Raises:
             InvalidPeerCharacteristics: If characteristics are outside [0.0, 1.0] range
@@ -63,10 +72,10 @@ class Peer:
         # Generate display name if not provided
         if display_name is not None:
             self.display_name = display_name
+        elif index is not None:
+            self.display_name = f"Peer-{index:03d}"
         else:
-            # Use last 3 characters of UUID for human-readable name
-            short_id = self.peer_id.split("-")[-1][:3].upper()
-            self.display_name = f"Peer-{short_id}"
+            self.display_name = f"Peer-{next(_peer_counter):03d}"
 
     def compute_interaction_outcome(self, partner: "Peer") -> bool:
         """Compute outcome of interaction with another peer.
@@ -5,10 +5,14 @@ and enforces invariants across all contained entities.
 """
 
 import random
+import time
 import uuid
-from datetime import datetime
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from enum import Enum
 
+import numpy as np
 import torch
 
 from eigentrust.algorithms.eigentrust import compute_eigentrust, compute_eigentrust_with_history
@@ -33,6 +37,50 @@ class SimulationState(Enum):
     FAILED = "failed"
 
 
+@dataclass(frozen=True)
+class PeerArrays:
+    """Structure-of-arrays view over a simulation's peers.
+
+    Exposes peer attributes as parallel NumPy arrays so visualization code
+    can use vectorized operations and O(1) id lookups instead of repeated
+    linear scans over Peer objects.
+
+    Attributes:
+        ids: Peer IDs in peer-list order
+        display_names: Display names in peer-list order
+        competence: Competence values as float32 array
+        maliciousness: Maliciousness values as float32 array
+        global_trust: Global trust scores as float32 array (0.0 if not computed)
+        id_to_index: Maps peer IDs to array indices
+    """
+
+    ids: np.ndarray
+    display_names: np.ndarray
+    competence: np.ndarray
+    maliciousness: np.ndarray
+    global_trust: np.ndarray
+    id_to_index: dict[str, int]
+
+
+@dataclass(frozen=True)
+class InteractionArrays:
+    """Structure-of-arrays view over a simulation's interactions.
+
+    Holds source/target peer indices and outcomes as parallel NumPy
+    arrays so trust assembly can run as bulk np.add.at scatters instead
+    of per-interaction attribute lookups.
+
+    Attributes:
+        sources: Source peer indices (into the peers list), int32
+        targets: Target peer indices (into the peers list), int32
+        successes: 1 where the interaction succeeded, 0 otherwise, uint8
+    """
+
+    sources: np.ndarray
+    targets: np.ndarray
+    successes: np.ndarray
+
+
 class Simulation:
     """Aggregate root for EigenTrust simulation.
 
@@ -61,12 +109,25 @@ class Simulation:
             random_seed: Optional random seed for reproducibility
         """
         self.simulation_id = simulation_id if simulation_id is not None else str(uuid.uuid4())
-        self.created_at = datetime.utcnow()
+        self.created_at = datetime.now(timezone.utc)
+        # Monotonic tick for cheap internal ordering; wall-clock
+        # created_at stays for serialization and display
+        self.created_at_ns = time.monotonic_ns()
         self.state = SimulationState.CREATED
         self.peers: list[Peer] = []
         self.interactions: list[Interaction] = []
         self.convergence_history: list = []  # Will be ConvergenceSnapshot objects
         self.random_seed = random_seed
+        self._peer_arrays: PeerArrays | None = None  # Lazily built SoA cache
+        self._trust_matrix_cache: TrustMatrix | None = None  # Memoized _build_trust_matrix result
+        self._interaction_arrays: InteractionArrays | None = None  # Memoized interaction SoA
+
+        # Characteristic columns kept in step with self.peers so vectorized
+        # consumers get contiguous float32 data without re-gathering
+        # attributes; grown geometrically as peers are appended
+        self._characteristic_count = 0
+        self._competence_column = np.empty(0, dtype=np.float32)
+        self._maliciousness_column = np.empty(0, dtype=np.float32)
 
         # Set random seed if provided
         if random_seed is not None:
@@ -97,8 +158,104 @@ class Simulation:
             peer_id=peer_id,
         )
         self.peers.append(peer)
+        self._peer_arrays = None
+        self._trust_matrix_cache = None
+        self._interaction_arrays = None
         return peer
 
+    def _sync_characteristic_columns(self) -> None:
+        """Bring the characteristic columns in step with self.peers.
+
+        Only peers appended since the last sync are copied in, so the
+        common add-one case writes a single element. Growth reallocates
+        geometrically to keep appends amortized O(1).
+        """
+        n = len(self.peers)
+        filled = self._characteristic_count
+        if filled == n:
+            return
+
+        if n > self._competence_column.shape[0]:
+            capacity = max(16, 2 * self._competence_column.shape[0], n)
+            for name in ("_competence_column", "_maliciousness_column"):
+                grown = np.empty(capacity, dtype=np.float32)
+                grown[:filled] = getattr(self, name)[:filled]
+                setattr(self, name, grown)
+
+        for i in range(filled, n):
+            peer = self.peers[i]
+            self._competence_column[i] = peer.competence
+            self._maliciousness_column[i] = peer.maliciousness
+        self._characteristic_count = n
+
+    @property
+    def competences(self) -> np.ndarray:
+        """Contiguous float32 view of peer competence values."""
+        self._sync_characteristic_columns()
+        return self._competence_column[: len(self.peers)]
+
+    @property
+    def maliciousnesses(self) -> np.ndarray:
+        """Contiguous float32 view of peer maliciousness values."""
+        self._sync_characteristic_columns()
+        return self._maliciousness_column[: len(self.peers)]
+
+    @property
+    def peer_soa(self) -> PeerArrays:
+        """Get structure-of-arrays view of peers (cached).
+
+        The view is rebuilt lazily whenever peers are added or global
+        trust scores change.
+
+        Returns:
+            PeerArrays with parallel NumPy arrays and id->index mapping
+        """
+        if self._peer_arrays is None:
+            self._peer_arrays = PeerArrays(
+                ids=np.array([p.peer_id for p in self.peers]),
+                display_names=np.array([p.display_name for p in self.peers]),
+                competence=self.competences,
+                maliciousness=self.maliciousnesses,
+                global_trust=np.array(
+                    [p.global_trust or 0.0 for p in self.peers], dtype=np.float32
+                ),
+                id_to_index=dict(zip((p.peer_id for p in self.peers), range(len(self.peers)))),
+            )
+        return self._peer_arrays
+
+    @property
+    def interaction_soa(self) -> InteractionArrays:
+        """Get structure-of-arrays view of interactions (cached).
+
+        Rebuilt lazily whenever peers or interactions change. The object
+        list remains the source of truth; this is a derived columnar view
+        for vectorized trust assembly.
+
+        Returns:
+            InteractionArrays with parallel source/target/success arrays
+        """
+        if self._interaction_arrays is None:
+            id_to_index = self.peer_soa.id_to_index
+            count = len(self.interactions)
+            self._interaction_arrays = InteractionArrays(
+                sources=np.fromiter(
+                    (id_to_index[x.source_peer_id] for x in self.interactions),
+                    dtype=np.int32,
+                    count=count,
+                ),
+                targets=np.fromiter(
+                    (id_to_index[x.target_peer_id] for x in self.interactions),
+                    dtype=np.int32,
+                    count=count,
+                ),
+                successes=np.fromiter(
+                    (x.outcome == InteractionOutcome.SUCCESS for x in self.interactions),
+                    dtype=np.uint8,
+                    count=count,
+                ),
+            )
+        return self._interaction_arrays
+
     def add_interaction(self, interaction: Interaction) -> None:
         """Add an interaction to the simulation.
 
@@ -123,6 +280,84 @@ class Simulation:
             )
 
         self.interactions.append(interaction)
+        self._trust_matrix_cache = None
+        self._interaction_arrays = None
+
+    def extend_interactions(self, interactions: Sequence[Interaction]) -> None:
+        """Add many interactions with a single validation pass.
+
+        Equivalent to calling add_interaction per item, but the peer-ID
+        set is built once for the whole batch and the records land in
+        one list.extend instead of per-call appends.
+
+        Args:
+            interactions: Interaction records to add
+
+        Raises:
+            OrphanInteractionError: If any interaction references an
+                unknown peer (no interactions are added in that case)
+        """
+        interactions = list(interactions)
+        peer_ids = {p.peer_id for p in self.peers}
+
+        for interaction in interactions:
+            if interaction.source_peer_id not in peer_ids:
+                raise OrphanInteractionError(
+                    f"Source peer {interaction.source_peer_id} not in simulation",
+                    interaction.source_peer_id,
+                )
+            if interaction.target_peer_id not in peer_ids:
+                raise OrphanInteractionError(
+                    f"Target peer {interaction.target_peer_id} not in simulation",
+                    interaction.target_peer_id,
+                )
+
+        self.interactions.extend(interactions)
+        self._trust_matrix_cache = None
+        self._interaction_arrays = None
+
+    def add_interactions_bulk(
+        self,
+        source_peer_ids: Sequence[str],
+        target_peer_ids: Sequence[str],
+        successes: Sequence[bool],
+    ) -> None:
+        """Add a batch of interactions from parallel SoA-style sequences.
+
+        Validates peer membership once for the whole batch instead of per
+        interaction, then appends all records in one pass. Pairs with
+        simulate_interaction_arrays for bulk interaction generation.
+
+        Args:
+            source_peer_ids: Peer IDs requesting service, one per interaction
+            target_peer_ids: Peer IDs providing service, one per interaction
+            successes: Whether each interaction succeeded
+
+        Raises:
+            ValueError: If the sequences have different lengths
+            OrphanInteractionError: If any ID references an unknown peer
+        """
+        if not (len(source_peer_ids) == len(target_peer_ids) == len(successes)):
+            raise ValueError("Bulk interaction sequences must have equal lengths")
+
+        peer_ids = {p.peer_id for p in self.peers}
+        for unknown in set(source_peer_ids) | set(target_peer_ids):
+            if unknown not in peer_ids:
+                raise OrphanInteractionError(
+                    f"Peer {unknown} not in simulation",
+                    unknown,
+                )
+
+        self.interactions.extend(
+            Interaction(
+                source_peer_id=source_id,
+                target_peer_id=target_id,
+                outcome=InteractionOutcome.SUCCESS if success else InteractionOutcome.FAILURE,
+            )
+            for source_id, target_id, success in zip(source_peer_ids, target_peer_ids, successes)
+        )
+        self._trust_matrix_cache = None
+        self._interaction_arrays = None
 
     def run_algorithm(
         self, max_iterations: int = 100, epsilon: float = 0.001, track_history: bool = False
@@ -148,6 +383,36 @@ class Simulation:
 
         self.state = SimulationState.RUNNING
 
+        # Cold start: with no interactions and no local trust, the matrix is
+        # empty and the uniform vector is the algorithm's fixed point under
+        # uniform pre-trust, so return it directly instead of iterating
+        if not self.interactions and not any(p.local_trust for p in self.peers):
+            uniform = 1.0 / len(self.peers)
+            scores = {p.peer_id: uniform for p in self.peers}
+            for peer in self.peers:
+                peer.global_trust = uniform
+            self._peer_arrays = None
+
+            if track_history:
+                self.convergence_history = [
+                    {
+                        "iteration": 0,
+                        "trust_scores": scores,
+                        "delta": 0.0,
+                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                    }
+                ]
+
+            self.state = SimulationState.COMPLETED
+            return TrustScores(
+                scores=scores,
+                iteration_count=0,
+                converged=True,
+                convergence_epsilon=epsilon,
+                final_delta=0.0,
+                history=self.convergence_history if track_history else [],
+            )
+
         try:
             # Build trust matrix from peer local trust or interactions
             trust_matrix = self._build_trust_matrix()
@@ -190,6 +455,7 @@ class Simulation:
             # Update peers with global trust scores
             for peer in self.peers:
                 peer.global_trust = scores[peer.peer_id]
+            self._peer_arrays = None  # Trust scores changed; rebuild SoA view on demand
 
             # Determine final delta
             if track_history and len(history) > 0:
@@ -230,28 +496,19 @@ class Simulation:
         Returns:
             Pre-trust vector (normalized to sum to 1.0)
         """
-        from collections import Counter
-
-        # Count total interactions and successes per peer (as target)
-        peer_stats = Counter()
-        peer_successes = Counter()
-
-        for interaction in self.interactions:
-            peer_stats[interaction.target_peer_id] += 1
-            if interaction.outcome == InteractionOutcome.SUCCESS:
-                peer_successes[interaction.target_peer_id] += 1
-
-        # Compute success rates
+        # Accumulate per-target totals and successes with bulk scatters
+        # over the columnar interaction view (matrix indices match
+        # peer_mapping, both follow peer-list order)
         n = len(self.peers)
-        success_rates = torch.zeros(n, dtype=torch.float32)
+        soa = self.interaction_soa
+        totals = np.zeros(n, dtype=np.float32)
+        successes = np.zeros(n, dtype=np.float32)
+        np.add.at(totals, soa.targets, 1.0)
+        np.add.at(successes, soa.targets, soa.successes.astype(np.float32))
 
-        for peer_id, idx in peer_mapping.items():
-            if peer_stats[peer_id] > 0:
-                success_rate = peer_successes[peer_id] / peer_stats[peer_id]
-                success_rates[idx] = success_rate
-            else:
-                # Peers with no interactions get neutral score
-                success_rates[idx] = 0.5
+        # Success rate per peer; peers with no interactions get neutral 0.5
+        rates = np.where(totals > 0, successes / np.maximum(totals, 1.0), 0.5)
+        success_rates = torch.from_numpy(rates.astype(np.float32))
 
         # Handle case where all peers have zero success
         if success_rates.sum() == 0:
@@ -263,6 +520,10 @@ class Simulation:
     def _build_trust_matrix(self) -> TrustMatrix:
         """Build trust matrix from peer local trust or interactions.
 
+        The result is memoized so visualization chains that need the matrix
+        several times (graph + heatmap) only materialize it once. The cache
+        is invalidated whenever peers or interactions change.
+
         Returns:
             TrustMatrix entity
 
@@ -270,9 +531,14 @@ class Simulation:
             If peers have no local trust values, they will be initialized
             based on interaction history (if available) or uniformly.
         """
+        if self._trust_matrix_cache is not None:
+            return self._trust_matrix_cache
+
         n = len(self.peers)
         matrix = torch.zeros(n, n, dtype=torch.float32)
-        peer_mapping = {peer.peer_id: idx for idx, peer in enumerate(self.peers)}
+        # dict(zip(...)) builds the mapping in C instead of a Python-level
+        # comprehension loop
+        peer_mapping = dict(zip((p.peer_id for p in self.peers), range(len(self.peers))))
 
         # Build matrix from peer local trust
         for i, peer_i in enumerate(self.peers):
@@ -290,7 +556,8 @@ class Simulation:
                         j = peer_mapping[peer_j_id]
                         matrix[i, j] = trust_value
 
-        return TrustMatrix(matrix=matrix, peer_mapping=peer_mapping)
+        self._trust_matrix_cache = TrustMatrix(matrix=matrix, peer_mapping=peer_mapping)
+        return self._trust_matrix_cache
 
     def _update_peer_local_trust_from_interactions(self, peer: Peer) -> None:
         """Update peer's local trust based on interaction history.
@@ -298,14 +565,14 @@ class Simulation:
         Args:
             peer: Peer to update
         """
-        # Find interactions where this peer was the source (requester)
-        peer_interactions = [
-            interaction
-            for interaction in self.interactions
-            if interaction.source_peer_id == peer.peer_id
-        ]
-
-        if not peer_interactions:
+        # Select interactions where this peer was the source (requester)
+        # from the columnar view: one vectorized mask instead of a Python
+        # scan over Interaction objects
+        soa = self.interaction_soa
+        peer_index = self.peer_soa.id_to_index[peer.peer_id]
+        mask = soa.sources == peer_index
+
+        if not mask.any():
             # No interactions: initialize uniform trust
             other_peers = [p for p in self.peers if p.peer_id != peer.peer_id]
             if other_peers:
@@ -313,35 +580,25 @@ class Simulation:
                 peer.local_trust = {p.peer_id: uniform_trust for p in other_peers}
             return
 
-        # Count successes and failures per target peer
-        from collections import defaultdict
-
-        interaction_counts = defaultdict(lambda: {"success": 0, "failure": 0})
-
-        for interaction in peer_interactions:
-            target_id = interaction.target_peer_id
-            if interaction.outcome == InteractionOutcome.SUCCESS:
-                interaction_counts[target_id]["success"] += 1
-            else:
-                interaction_counts[target_id]["failure"] += 1
+        # Count successes and totals per target peer with bulk scatters
+        n = len(self.peers)
+        totals = np.zeros(n, dtype=np.float32)
+        successes = np.zeros(n, dtype=np.float32)
+        np.add.at(totals, soa.targets[mask], 1.0)
+        np.add.at(successes, soa.targets[mask], soa.successes[mask].astype(np.float32))
 
-        # Compute local trust: success_rate
-        local_trust = {}
-        for target_id, counts in interaction_counts.items():
-            total = counts["success"] + counts["failure"]
-            if total > 0:
-                success_rate = counts["success"] / total
-                local_trust[target_id] = success_rate
+        # Compute local trust: success_rate per interacted-with target
+        (involved,) = np.nonzero(totals)
+        rates = successes[involved] / totals[involved]
+        target_ids = [self.peers[j].peer_id for j in involved.tolist()]
 
         # Normalize to sum to 1.0
-        total_trust = sum(local_trust.values())
+        total_trust = float(rates.sum())
         if total_trust > 0:
-            peer.local_trust = {
-                peer_id: trust / total_trust for peer_id, trust in local_trust.items()
-            }
+            peer.local_trust = dict(zip(target_ids, (rates / total_trust).tolist()))
         else:
             # All failures: assign minimal trust uniformly
-            peer.local_trust = {peer_id: 1.0 / len(local_trust) for peer_id in local_trust.keys()}
+            peer.local_trust = {target_id: 1.0 / len(target_ids) for target_id in target_ids}
 
     def simulate_interactions(
         self, count: int, use_preferential_attachment: bool = False
@@ -379,14 +636,17 @@ class Simulation:
         )
 
         # Add interactions to simulation history
+        peer_by_id = {p.peer_id: p for p in self.peers}
         for interaction in new_interactions:
             self.interactions.append(interaction)
 
             # Update local trust for source peer based on outcome
-            source_peer = next(p for p in self.peers if p.peer_id == interaction.source_peer_id)
+            source_peer = peer_by_id[interaction.source_peer_id]
             success = interaction.outcome == InteractionOutcome.SUCCESS
             source_peer.update_local_trust(interaction.target_peer_id, success)
 
+        self._trust_matrix_cache = None  # Local trust changed; matrix must be rebuilt
+        self._interaction_arrays = None
         return new_interactions
 
     def to_dict(self) -> dict:
@@ -20,33 +20,49 @@ class TrustMatrix:
     """
 
     def __init__(
-        self, matrix: torch.Tensor, peer_mapping: dict[str, int], normalized: bool = False
+        self,
+        matrix: torch.Tensor | np.ndarray,
+        peer_mapping: dict[str, int],
+        normalized: bool = False,
     ):
         """Initialize trust matrix.
 
         Args:
-            matrix: PyTorch tensor of trust values
+            matrix: Trust values as a PyTorch tensor or NumPy array
             peer_mapping: Dictionary mapping peer IDs to matrix indices
             normalized: Whether matrix is already column-normalized
 
         Raises:
             ValueError: If matrix is not square or contains invalid values
         """
-        # Validate square matrix
+        # Accept NumPy input so callers (and tests) working on small
+        # matrices do not need to build tensors themselves; from_numpy is
+        # zero-copy and the clone below takes ownership
+        if isinstance(matrix, np.ndarray):
+            matrix = torch.from_numpy(np.ascontiguousarray(matrix))
+
+        # Cheap O(1) structural checks first so invalid shapes never pay
+        # for the O(n²) value scan
         if matrix.dim() != 2 or matrix.shape[0] != matrix.shape[1]:
             raise ValueError("Trust matrix must be square")
 
-        # Validate non-negative values
-        if (matrix < 0).any():
-            raise ValueError("Trust matrix must contain only non-negative values")
-
-        # Validate peer_mapping size matches matrix
         if len(peer_mapping) != matrix.shape[0]:
             raise ValueError("Peer mapping size must match matrix dimensions")
 
-        self._matrix = matrix.clone()  # Store a copy to prevent external modification
+        # min() reduces without materializing an N×N boolean mask
+        if matrix.numel() > 0 and matrix.min().item() < 0.0:
+            raise ValueError("Trust matrix must contain only non-negative values")
+
+        # Keep float32 storage: trust values are in [0, 1] and float64
+        # precision buys nothing while doubling memory for the N×N matrix.
+        # Stored contiguous so downstream matmul kernels see a
+        # predictable strided layout; clone only when to()/contiguous()
+        # were no-ops, so exactly one copy separates us from the caller.
+        converted = matrix.to(torch.float32).contiguous()
+        self._matrix = converted if converted is not matrix else matrix.clone()
         self._peer_mapping = peer_mapping.copy()
         self._normalized = normalized
+        self._numpy_cache: np.ndarray | None = None  # Memoized to_numpy() export
 
     @property
     def matrix(self) -> torch.Tensor:
@@ -99,14 +115,42 @@ class TrustMatrix:
         j = self._peer_mapping[trustee_id]
         self._matrix[i, j] = value
         self._normalized = False  # Setting values invalidates normalization
+        self._numpy_cache = None
 
     def to_numpy(self) -> np.ndarray:
         """Export matrix as NumPy array for visualization.
 
+        The export is memoized so multiple visualizers sharing a matrix
+        do not re-materialize it; the cache is cleared by set_trust.
+        Values are always exported as float32: trust values live in [0, 1]
+        and are displayed at ~2-decimal precision, so the narrower dtype
+        halves memory traffic in visualization scans.
+
         Returns:
-            NumPy array of trust values
+            NumPy array of trust values (float32)
+        """
+        if self._numpy_cache is None:
+            # Zero-copy view: storage is always contiguous CPU float32
+            self._numpy_cache = self._matrix.detach().numpy()
+        return self._numpy_cache
+
+    def iter_nonzero(self, threshold: float = 0.0):
+        """Iterate over matrix entries strictly above a threshold.
+
+        Lets consumers (e.g. graph construction) work on the O(nnz)
+        populated entries instead of scanning all N² cells in Python;
+        the cell scan itself happens in C-level NumPy.
+
+        Args:
+            threshold: Minimum value (exclusive) for an entry to be yielded
+
+        Yields:
+            Tuples of (row, col, value) for qualifying entries
         """
-        return self._matrix.detach().cpu().numpy()
+        matrix_np = self.to_numpy()
+        rows, cols = np.nonzero(matrix_np > threshold)
+        values = matrix_np[rows, cols]
+        yield from zip(rows.tolist(), cols.tolist(), values.tolist())
 
     def normalize_columns(self) -> "TrustMatrix":
         """Normalize matrix to column-stochastic form.
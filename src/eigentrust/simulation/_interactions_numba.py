@@ -0,0 +1,63 @@
+"""Optional Numba-accelerated kernel for batch interaction outcomes.
+
+When numba is installed, the outcome arithmetic compiles to native code
+and drops CPython dispatch entirely; otherwise a vectorized NumPy
+fallback provides the same semantics. Callers import
+compute_outcomes_batch and never need to know which path is active.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    HAVE_NUMBA = True
+except ImportError:
+    njit = None
+    HAVE_NUMBA = False
+
+
+def _compute_outcomes_batch_loop(
+    competence: np.ndarray,
+    maliciousness: np.ndarray,
+    target_indices: np.ndarray,
+    noise: np.ndarray,
+    uniform: np.ndarray,
+) -> np.ndarray:
+    """Scalar loop over the outcome formula, written for Numba lowering.
+
+    P(success) = (1 - competence) * (1 - maliciousness) + noise, clamped
+    to [0, 1], compared against a uniform draw (matching
+    compute_interaction_outcome).
+    """
+    out = np.empty(target_indices.shape[0], dtype=np.uint8)
+    for i in range(target_indices.shape[0]):
+        j = target_indices[i]
+        p = (1.0 - competence[j]) * (1.0 - maliciousness[j]) + noise[i]
+        # Branchless clamp: lowers to min/max instructions instead of
+        # data-dependent jumps
+        p = 0.0 if p < 0.0 else (1.0 if p > 1.0 else p)
+        out[i] = uniform[i] < p
+    return out
+
+
+def _compute_outcomes_batch_numpy(
+    competence: np.ndarray,
+    maliciousness: np.ndarray,
+    target_indices: np.ndarray,
+    noise: np.ndarray,
+    uniform: np.ndarray,
+) -> np.ndarray:
+    """Vectorized NumPy fallback with identical semantics."""
+    prob = (1.0 - competence[target_indices]) * (1.0 - maliciousness[target_indices]) + noise
+    np.clip(prob, 0.0, 1.0, out=prob)
+    return (uniform < prob).astype(np.uint8)
+
+
+if HAVE_NUMBA:
+    compute_outcomes_batch = njit(cache=True, fastmath=True)(_compute_outcomes_batch_loop)
+    # Warm the JIT at import so the first simulation doesn't pay compile time
+    _one = np.zeros(1, dtype=np.float64)
+    compute_outcomes_batch(_one, _one, np.zeros(1, dtype=np.int64), _one, _one)
+else:
+    compute_outcomes_batch = _compute_outcomes_batch_numpy
@@ -6,11 +6,16 @@ Simulates peer-to-peer interactions based on peer characteristics.
 import random
 from collections import defaultdict
 
+import numpy as np
+
 from eigentrust.domain.interaction import Interaction, InteractionOutcome
 from eigentrust.domain.peer import Peer
+from eigentrust.simulation._interactions_numba import compute_outcomes_batch
 
 
-def compute_interaction_outcome(peer: Peer, partner: Peer) -> InteractionOutcome:
+def compute_interaction_outcome(
+    peer: Peer, partner: Peer, rng: random.Random | None = None
+) -> InteractionOutcome:
     """Compute outcome of interaction based on peer characteristics.
 
     Success probability formula:
@@ -24,6 +29,9 @@ def compute_interaction_outcome(peer: Peer, partner: Peer) -> InteractionOutcome
     Args:
         peer: Peer providing service (target)
         partner: Peer requesting service (source)
+        rng: Optional random source; defaults to the module-level
+            random. Injecting an instance keeps draws isolated from
+            global state and lets tests pass a stub directly.
 
     Returns:
         InteractionOutcome.SUCCESS or InteractionOutcome.FAILURE
@@ -34,6 +42,9 @@ def compute_interaction_outcome(peer: Peer, partner: Peer) -> InteractionOutcome
         >>> outcome = compute_interaction_outcome(peer, partner)
         >>> # Good peer has high success probability
     """
+    if rng is None:
+        rng = random
+
     # Base success rate: inversely related to incompetence
     technical_success = 1.0 - peer.competence
 
@@ -44,13 +55,11 @@ def compute_interaction_outcome(peer: Peer, partner: Peer) -> InteractionOutcome
     base_prob = technical_success * cooperation_factor
 
     # Add small random noise for realism
-    noise = random.gauss(0, 0.05)
+    noise = rng.gauss(0, 0.05)
     final_prob = max(0.0, min(1.0, base_prob + noise))
 
     # Determine outcome
-    return (
-        InteractionOutcome.SUCCESS if random.random() < final_prob else InteractionOutcome.FAILURE
-    )
+    return InteractionOutcome.SUCCESS if rng.random() < final_prob else InteractionOutcome.FAILURE
 
 
 def simulate_interactions(
@@ -88,9 +97,22 @@ def simulate_interactions(
     if len(peers) < 2:
         raise ValueError("Need at least 2 peers to simulate interactions")
 
-    # Set random seed for reproducibility
-    if seed is not None:
-        random.seed(seed)
+    # Uniform selection has no cross-interaction dependencies, so the whole
+    # batch can be drawn at once instead of one Python iteration per record
+    if not use_preferential_attachment:
+        sources, targets, successes = simulate_interaction_arrays(peers, num_interactions, seed)
+        return [
+            Interaction(
+                source_peer_id=peers[s].peer_id,
+                target_peer_id=peers[t].peer_id,
+                outcome=InteractionOutcome.SUCCESS if ok else InteractionOutcome.FAILURE,
+            )
+            for s, t, ok in zip(sources.tolist(), targets.tolist(), successes.tolist())
+        ]
+
+    # Instance-scoped RNG keeps the draws reproducible without mutating
+    # the module-global random state
+    rng = random.Random(seed)
 
     interactions = []
 
@@ -104,29 +126,23 @@ def simulate_interactions(
 
     for _ in range(num_interactions):
         # Select source uniformly (requesters chosen randomly)
-        source = random.choice(peers)
-
-        # Select target based on preferential attachment or uniformly
-        if use_preferential_attachment:
-            # Build probability distribution based on success counts
-            # Peers with more successful interactions are more likely to be selected
-            available_targets = [p for p in peers if p.peer_id != source.peer_id]
-            weights = [peer_success_counts[p.peer_id] for p in available_targets]
-            total_weight = sum(weights)
-
-            if total_weight > 0:
-                probabilities = [w / total_weight for w in weights]
-                target = random.choices(available_targets, weights=probabilities, k=1)[0]
-            else:
-                # Fallback to uniform if no weights
-                target = random.choice(available_targets)
+        source = rng.choice(peers)
+
+        # Build probability distribution based on success counts
+        # Peers with more successful interactions are more likely to be selected
+        available_targets = [p for p in peers if p.peer_id != source.peer_id]
+        weights = [peer_success_counts[p.peer_id] for p in available_targets]
+        total_weight = sum(weights)
+
+        if total_weight > 0:
+            probabilities = [w / total_weight for w in weights]
+            target = rng.choices(available_targets, weights=probabilities, k=1)[0]
         else:
-            # Uniform random selection (original behavior)
-            available_targets = [p for p in peers if p.peer_id != source.peer_id]
-            target = random.choice(available_targets)
+            # Fallback to uniform if no weights
+            target = rng.choice(available_targets)
 
         # Compute outcome based on target peer's characteristics
-        outcome = compute_interaction_outcome(target, source)
+        outcome = compute_interaction_outcome(target, source, rng=rng)
 
         # Update success counts for preferential attachment
         if outcome == InteractionOutcome.SUCCESS:
@@ -140,3 +156,53 @@ def simulate_interactions(
         interactions.append(interaction)
 
     return interactions
+
+
+def simulate_interaction_arrays(
+    peers: list[Peer], num_interactions: int, seed: int | None = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Simulate uniform-selection interactions as SoA index arrays.
+
+    Generates the whole batch with vectorized NumPy draws: one array of
+    source indices, one of target indices, and one success mask, instead
+    of per-interaction Python RNG calls and object allocation. Outcome
+    probabilities follow compute_interaction_outcome:
+    P(success) = (1 - competence) * (1 - maliciousness) + gaussian noise.
+
+    Args:
+        peers: List of peers in the network
+        num_interactions: Number of interactions to simulate
+        seed: Optional random seed for reproducibility
+
+    Returns:
+        Tuple of (source_indices, target_indices, successes) arrays, where
+        indices refer to positions in the peers list
+
+    Raises:
+        ValueError: If fewer than 2 peers provided
+    """
+    if len(peers) < 2:
+        raise ValueError("Need at least 2 peers to simulate interactions")
+
+    n = len(peers)
+    rng = np.random.default_rng(seed)
+
+    sources = rng.integers(0, n, size=num_interactions)
+    # Draw targets from n-1 slots and shift past the source to exclude
+    # self-interaction without rejection sampling
+    targets = rng.integers(0, n - 1, size=num_interactions)
+    targets[targets >= sources] += 1
+
+    competence = np.fromiter((p.competence for p in peers), dtype=np.float64, count=n)
+    maliciousness = np.fromiter((p.maliciousness for p in peers), dtype=np.float64, count=n)
+
+    # Outcome depends on the target peer's characteristics plus noise;
+    # the arithmetic runs in the batch kernel (Numba-compiled when
+    # available, vectorized NumPy otherwise)
+    noise = rng.normal(0.0, 0.05, size=num_interactions)
+    uniform = rng.random(num_interactions)
+    successes = compute_outcomes_batch(
+        competence, maliciousness, targets.astype(np.int64), noise, uniform
+    )
+
+    return sources, targets, successes.astype(bool)
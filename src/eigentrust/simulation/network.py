@@ -3,14 +3,41 @@
 Provides functions to create peer networks with different characteristic distributions.
 """
 
-import random
+import os
+import uuid
+
+import numpy as np
 
 from eigentrust.domain import InsufficientPeersError, InvalidPeerCharacteristics
+from eigentrust.domain.peer import Peer
 from eigentrust.domain.simulation import Simulation
-from eigentrust.simulation.behaviors import (
-    generate_adversarial_characteristics,
-    generate_random_characteristics,
-)
+
+
+_VALID_PRESETS = frozenset({"random", "uniform", "adversarial"})
+
+
+def _generate_peer_ids(count: int) -> list[str]:
+    """Generate random version-4 UUID strings from one entropy draw.
+
+    uuid.uuid4() reads 16 bytes from the OS entropy source per call; for
+    large networks that is one syscall per peer. Drawing all the bytes at
+    once and setting the version/variant bits manually yields identical
+    UUIDs at a fraction of the cost.
+
+    Args:
+        count: Number of UUIDs to generate
+
+    Returns:
+        List of canonical UUID strings
+    """
+    raw = os.urandom(16 * count)
+    ids = []
+    for i in range(count):
+        b = bytearray(raw[i * 16 : (i + 1) * 16])
+        b[6] = (b[6] & 0x0F) | 0x40
+        b[8] = (b[8] & 0x3F) | 0x80
+        ids.append(str(uuid.UUID(bytes=bytes(b))))
+    return ids
 
 
 def create_network(
@@ -47,34 +74,64 @@ def create_network(
             maliciousness=0.0,
         )
 
-    # Validate preset
-    valid_presets = ["random", "uniform", "adversarial"]
-    if preset not in valid_presets:
+    # Validate preset with an O(1) set lookup
+    if preset not in _VALID_PRESETS:
         raise ValueError(
-            f"Invalid preset '{preset}'. " f"Must be one of: {', '.join(valid_presets)}"
+            f"Invalid preset '{preset}'. " f"Must be one of: {', '.join(sorted(_VALID_PRESETS))}"
         )
 
     # Create simulation
     sim = Simulation(random_seed=seed)
 
-    # Set random seed if provided
-    if seed is not None:
-        random.seed(seed)
-
-    # Generate peers based on preset
-    for i in range(peer_count):
-        if preset == "random":
-            competence, maliciousness = generate_random_characteristics()
-        elif preset == "uniform":
-            competence, maliciousness = 0.5, 0.5
-        elif preset == "adversarial":
-            competence, maliciousness = generate_adversarial_characteristics(
-                peer_index=i,
-                total_peers=peer_count,
-            )
+    # Generate all peer IDs from a single entropy draw
+    peer_ids = _generate_peer_ids(peer_count)
+
+    # Draw all characteristics in one vectorized pass instead of two
+    # random.uniform calls per peer
+    rng = np.random.default_rng(seed)
+
+    if preset == "random":
+        competences = rng.random(peer_count)
+        maliciousnesses = rng.random(peer_count)
+    elif preset == "uniform":
+        competences = np.full(peer_count, 0.5)
+        maliciousnesses = np.full(peer_count, 0.5)
+    else:  # adversarial
+        # Same index-based partition as before: 30% good [0.0, 0.2],
+        # 40% neutral [0.4, 0.6], 30% bad [0.8, 1.0]
+        good_count = int(peer_count * 0.3)
+        neutral_count = int(peer_count * 0.4)
+        lower = np.full(peer_count, 0.8)
+        lower[:good_count] = 0.0
+        lower[good_count : good_count + neutral_count] = 0.4
+        competences = lower + 0.2 * rng.random(peer_count)
+        maliciousnesses = lower + 0.2 * rng.random(peer_count)
+
+    # Validate the whole batch once up front; Peer's own per-instance
+    # checks then never fire in practice
+    if not (
+        np.all((competences >= 0.0) & (competences <= 1.0))
+        and np.all((maliciousnesses >= 0.0) & (maliciousnesses <= 1.0))
+    ):
+        raise InvalidPeerCharacteristics(
+            "Generated characteristics outside [0.0, 1.0]",
+            competence=float(competences.min()),
+            maliciousness=float(maliciousnesses.min()),
+        )
 
-        # Add peer to simulation
-        sim.add_peer(competence=competence, maliciousness=maliciousness)
+    # Append directly with locals bound outside the loop. The simulation
+    # is freshly created, so the cache invalidation add_peer performs is
+    # a no-op here
+    append = sim.peers.append
+    make_peer = Peer
+    for i, (peer_id, competence, maliciousness) in enumerate(
+        zip(peer_ids, competences.tolist(), maliciousnesses.tolist())
+    ):
+        append(
+            make_peer(
+                competence=competence, maliciousness=maliciousness, peer_id=peer_id, index=i
+            )
+        )
 
     return sim
 
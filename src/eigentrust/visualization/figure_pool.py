@@ -0,0 +1,74 @@
+"""Shared matplotlib figure pool for EigenTrust visualizers.
+
+Creating a Figure pays matplotlib's Axes/spine/tick setup cost on every
+call, which is a large fraction of total plot time. Visualizers render
+repeatedly with a handful of fixed layouts (CLI workflows emit matrix,
+graph, and convergence plots together), so figures are pooled by layout
+and cleared between renders instead of being recreated.
+"""
+
+import atexit
+import os
+import threading
+
+import matplotlib
+
+# All visualizers render to files, so select the Agg backend up front and
+# skip GUI backend probing/initialization. An explicit MPLBACKEND choice
+# from the user still wins.
+if os.environ.get("MPLBACKEND") is None:
+    matplotlib.use("Agg", force=True)
+
+import matplotlib.pyplot as plt  # noqa: E402
+
+# Figures are pooled per thread so concurrent renders can never share a
+# Figure, even when two visualizers use the same (figsize, nrows, ncols)
+# layout. A flat registry tracks every pooled figure for atexit teardown.
+_POOL = threading.local()
+_ALL_FIGURES: list[plt.Figure] = []
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_figure(figsize: tuple[float, float], nrows: int = 1, ncols: int = 1):
+    """Get a pooled Figure with freshly created Axes.
+
+    Cache hits clear the existing figure and rebuild its subplots, which
+    is significantly cheaper than constructing a new Figure. The pool is
+    thread-local, so the returned figure is never shared with another
+    thread. Callers must not close the returned figure; teardown happens
+    at interpreter exit.
+
+    Args:
+        figsize: Figure size in inches (width, height)
+        nrows: Number of subplot rows
+        ncols: Number of subplot columns
+
+    Returns:
+        Tuple of (figure, axes) as returned by Figure.subplots
+    """
+    cache = getattr(_POOL, "figures", None)
+    if cache is None:
+        cache = _POOL.figures = {}
+
+    key = (figsize, nrows, ncols)
+    fig = cache.get(key)
+    if fig is None:
+        fig = plt.figure(figsize=figsize)
+        cache[key] = fig
+        with _REGISTRY_LOCK:
+            _ALL_FIGURES.append(fig)
+    else:
+        fig.clear()
+    axes = fig.subplots(nrows, ncols)
+    return fig, axes
+
+
+def _close_pooled_figures() -> None:
+    """Close all pooled figures (registered as atexit teardown)."""
+    with _REGISTRY_LOCK:
+        for fig in _ALL_FIGURES:
+            plt.close(fig)
+        _ALL_FIGURES.clear()
+
+
+atexit.register(_close_pooled_figures)
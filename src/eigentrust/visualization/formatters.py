@@ -7,8 +7,13 @@ import warnings
 from pathlib import Path
 
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba_array
+from matplotlib.lines import Line2D
 
 from eigentrust.domain.simulation import Simulation
+from eigentrust.visualization.figure_pool import get_figure
 
 
 class ConvergencePlotter:
@@ -21,11 +26,11 @@ class ConvergencePlotter:
         show_top_n: Number of top peers to highlight in plots
     """
 
-    def __init__(self, dpi: int = 300, show_top_n: int = 5):
+    def __init__(self, dpi: int = 150, show_top_n: int = 5):
         """Initialize convergence plotter.
 
         Args:
-            dpi: Resolution for saved images (default: 300)
+            dpi: Resolution for saved images (default: 150)
             show_top_n: Number of peers to highlight (default: 5)
         """
         self.dpi = dpi
@@ -47,8 +52,8 @@ class ConvergencePlotter:
         if not simulation.convergence_history:
             raise ValueError("Simulation has no convergence history. Run with track_history=True")
 
-        # Create figure with two subplots
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
+        # Get pooled figure with two subplots
+        fig, (ax1, ax2) = get_figure(figsize=(12, 10), nrows=2)
 
         # Plot 1: Trust scores over iterations
         self._plot_trust_evolution(ax1, simulation)
@@ -65,12 +70,11 @@ class ConvergencePlotter:
         with warnings.catch_warnings():
             warnings.filterwarnings("ignore", message="Tight layout not applied")
             try:
-                plt.tight_layout()
+                fig.tight_layout()
             except (ValueError, UserWarning):
-                # Tight layout may fail with complex plots - ignore and use bbox_inches='tight' instead
+                # Tight layout may fail with complex plots - fall back to default margins
                 pass
-        plt.savefig(output_path, dpi=self.dpi, bbox_inches="tight")
-        plt.close(fig)
+        fig.savefig(output_path, dpi=self.dpi, pil_kwargs={"compress_level": 1})
 
     def _plot_trust_evolution(self, ax, simulation: Simulation) -> None:
         """Plot trust scores over iterations.
@@ -81,26 +85,47 @@ class ConvergencePlotter:
         """
         history = simulation.convergence_history
 
-        # Extract iterations
-        iterations = [h["iteration"] for h in history]
+        # Iteration indices are 0..len(history)-1 by construction
+        iterations = np.arange(len(history))
 
         # Get final scores to determine top peers
         final_scores = history[-1]["trust_scores"]
         sorted_peers = sorted(final_scores.items(), key=lambda x: x[1], reverse=True)
         top_peer_ids = [peer_id for peer_id, _ in sorted_peers[: self.show_top_n]]
 
-        # Plot trust score evolution for top peers
-        for peer_id in top_peer_ids:
-            scores = [h["trust_scores"][peer_id] for h in history]
-            peer = next(p for p in simulation.peers if p.peer_id == peer_id)
-            ax.plot(
-                iterations,
-                scores,
+        # Plot trust score evolution for top peers as a single LineCollection
+        # plus one scatter for markers: two artists instead of one Line2D per
+        # peer, so the draw/savefig walk stays flat as show_top_n grows
+        peer_by_id = {p.peer_id: p for p in simulation.peers}
+        it_arr = iterations.astype(np.float64)
+        scores = np.array([[h["trust_scores"][pid] for pid in top_peer_ids] for h in history])
+
+        cycle_colors = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+        line_colors = [cycle_colors[k % len(cycle_colors)] for k in range(len(top_peer_ids))]
+
+        segments = [np.column_stack([it_arr, scores[:, k]]) for k in range(len(top_peer_ids))]
+        ax.add_collection(LineCollection(segments, colors=line_colors, linewidths=2))
+        ax.scatter(
+            np.tile(it_arr, len(top_peer_ids)),
+            scores.T.ravel(),
+            s=9,
+            c=np.repeat(to_rgba_array(line_colors), len(it_arr), axis=0),
+        )
+        ax.autoscale_view()
+
+        # Proxy artists for the legend (LineCollection has no per-line labels)
+        legend_handles = [
+            Line2D(
+                [0],
+                [0],
+                color=line_colors[k],
+                linewidth=2,
                 marker="o",
                 markersize=3,
-                label=f"{peer.display_name} (final: {final_scores[peer_id]:.4f})",
-                linewidth=2,
+                label=f"{peer_by_id[pid].display_name} (final: {final_scores[pid]:.4f})",
             )
+            for k, pid in enumerate(top_peer_ids)
+        ]
 
         # Plot average for all other peers (gray line)
         other_peer_ids = [p.peer_id for p in simulation.peers if p.peer_id not in top_peer_ids]
@@ -109,7 +134,7 @@ class ConvergencePlotter:
             for h in history:
                 avg = sum(h["trust_scores"][pid] for pid in other_peer_ids) / len(other_peer_ids)
                 avg_scores.append(avg)
-            ax.plot(
+            (avg_line,) = ax.plot(
                 iterations,
                 avg_scores,
                 color="gray",
@@ -118,11 +143,12 @@ class ConvergencePlotter:
                 alpha=0.5,
                 label=f"Average of other {len(other_peer_ids)} peers",
             )
+            legend_handles.append(avg_line)
 
         ax.set_xlabel("Iteration", fontsize=12)
         ax.set_ylabel("Trust Score", fontsize=12)
         ax.set_title("Trust Score Evolution Over Iterations", fontsize=13, fontweight="bold")
-        ax.legend(loc="best", fontsize=9)
+        ax.legend(handles=legend_handles, loc="upper right", fontsize=9)
         ax.grid(True, alpha=0.3)
         ax.set_ylim(0, None)  # Start y-axis at 0
 
@@ -136,8 +162,10 @@ class ConvergencePlotter:
         history = simulation.convergence_history
 
         # Extract iterations and deltas (skip iteration 0 which has delta=1.0)
-        iterations = [h["iteration"] for h in history[1:]]
-        deltas = [h["delta"] for h in history[1:]]
+        iterations = np.arange(1, len(history))
+        deltas = np.fromiter(
+            (h["delta"] for h in history[1:]), dtype=np.float32, count=len(history) - 1
+        )
 
         # Plot delta on log scale
         ax.semilogy(
@@ -166,16 +194,14 @@ class ConvergencePlotter:
         ax.set_xlabel("Iteration", fontsize=12)
         ax.set_ylabel("Delta (log scale)", fontsize=12)
         ax.set_title("Convergence Metric Over Iterations", fontsize=13, fontweight="bold")
-        ax.legend(loc="best", fontsize=10)
+        ax.legend(loc="upper right", fontsize=10)
         ax.grid(True, alpha=0.3, which="both")
 
         # Add annotation for convergence point if converged
-        if len(deltas) > 0:
-            converged_idx = None
-            for i, delta in enumerate(deltas):
-                if delta < epsilon:
-                    converged_idx = i
-                    break
+        if deltas.size > 0:
+            # Vectorized search for the first iteration below epsilon
+            below = deltas < epsilon
+            converged_idx = int(np.argmax(below)) if below.any() else None
 
             if converged_idx is not None:
                 converged_at = iterations[converged_idx]
@@ -7,8 +7,10 @@ from pathlib import Path
 
 import matplotlib.pyplot as plt
 import networkx as nx
+import numpy as np
 
 from eigentrust.domain.simulation import Simulation
+from eigentrust.visualization.figure_pool import get_figure
 
 
 class GraphVisualizer:
@@ -26,18 +28,19 @@ class GraphVisualizer:
     """
 
     def __init__(
-        self, dpi: int = 300, edge_threshold: float = 0.01, layout_algorithm: str = "spring"
+        self, dpi: int = 150, edge_threshold: float = 0.01, layout_algorithm: str = "spring"
     ):
         """Initialize graph visualizer.
 
         Args:
-            dpi: Resolution for saved images (default: 300)
+            dpi: Resolution for saved images (default: 150)
             edge_threshold: Min trust value for edges (default: 0.01)
             layout_algorithm: Layout type (spring, circular, kamada_kawai)
         """
         self.dpi = dpi
         self.edge_threshold = edge_threshold
         self.layout_algorithm = layout_algorithm
+        self._layout_cache: dict[str, dict] = {}  # simulation_id -> node positions
 
     def visualize(
         self,
@@ -60,8 +63,8 @@ class GraphVisualizer:
         # Build directed graph from simulation
         G = self._build_graph(simulation)
 
-        # Get layout
-        pos = self._compute_layout(G)
+        # Get layout (cached per simulation for repeated renders)
+        pos = self._compute_layout(G, cache_key=simulation.simulation_id)
 
         # Prepare node visual properties
         node_colors = self._compute_node_colors(simulation)
@@ -70,8 +73,8 @@ class GraphVisualizer:
         # Prepare edge visual properties
         edge_widths = self._compute_edge_widths(G)
 
-        # Create figure
-        fig, ax = plt.subplots(figsize=(12, 10))
+        # Get pooled figure
+        fig, ax = get_figure(figsize=(12, 10))
 
         # Draw edges with varying thickness
         nx.draw_networkx_edges(
@@ -108,10 +111,9 @@ class GraphVisualizer:
         # Remove axis
         ax.axis("off")
 
-        # Save figure
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=self.dpi, bbox_inches="tight")
-        plt.close(fig)
+        # Save figure (pooled; not closed here)
+        fig.tight_layout()
+        fig.savefig(output_path, dpi=self.dpi, pil_kwargs={"compress_level": 1})
 
     def _build_graph(self, simulation: Simulation) -> nx.DiGraph:
         """Build NetworkX directed graph from simulation.
@@ -136,53 +138,71 @@ class GraphVisualizer:
 
         # Build trust matrix
         trust_matrix = simulation._build_trust_matrix()
-        matrix_np = trust_matrix.to_numpy()
 
-        # Add edges for non-zero trust values above threshold
+        # Add edges for trust values above threshold: iterate only the
+        # populated entries (O(nnz)) rather than all N² cells
         peer_ids = list(trust_matrix.peer_mapping.keys())
-        for i, source_id in enumerate(peer_ids):
-            for j, target_id in enumerate(peer_ids):
-                if i != j:  # Skip self-loops
-                    trust_value = matrix_np[i, j]
-                    if trust_value > self.edge_threshold:
-                        G.add_edge(source_id, target_id, weight=float(trust_value))
+        G.add_edges_from(
+            (peer_ids[i], peer_ids[j], {"weight": w})
+            for i, j, w in trust_matrix.iter_nonzero(threshold=self.edge_threshold)
+            if i != j  # Skip self-loops
+        )
 
         return G
 
-    def _compute_layout(self, G: nx.DiGraph) -> dict:
+    def _compute_layout(self, G: nx.DiGraph, cache_key: str | None = None) -> dict:
         """Compute force-directed graph layout positions.
 
         Uses Fruchterman-Reingold force-directed algorithm (spring layout)
-        with edge weights to cluster trusted peers together.
+        with edge weights to cluster trusted peers together. Spring iteration
+        count scales down with graph size: each iteration touches every node
+        pair, so 100 iterations on a large graph dominates total render time
+        for marginal layout improvement.
 
         Args:
             G: NetworkX graph
+            cache_key: Optional key (e.g. simulation ID) to cache positions
+                under, so repeated renders of the same network skip the layout
 
         Returns:
             Dictionary mapping node IDs to (x, y) positions
         """
+        if cache_key is not None:
+            cached = self._layout_cache.get(cache_key)
+            # Reuse positions only while the node set is unchanged; a
+            # peer added since the last render must trigger a fresh layout
+            if cached is not None and set(cached) == set(G.nodes):
+                return cached
+
+        # Fewer iterations for larger graphs (never below 20)
+        n = G.number_of_nodes()
+        iterations = 100 if n <= 100 else max(20, 2000 // n)
+
         if self.layout_algorithm == "spring":
             # Force-directed layout with edge weight consideration
             # k: optimal distance between nodes
-            # iterations: more iterations = better layout
             # weight: edge attribute to use for spring force (higher weight = shorter distance)
-            return nx.spring_layout(
+            pos = nx.spring_layout(
                 G,
                 k=2.0,  # Increase spacing
-                iterations=100,  # More iterations for better convergence
+                iterations=iterations,
                 weight="weight",  # Use trust weights
                 seed=42,
             )
         elif self.layout_algorithm == "circular":
-            return nx.circular_layout(G)
+            pos = nx.circular_layout(G)
         elif self.layout_algorithm == "kamada_kawai":
             # Kamada-Kawai also respects edge weights
-            return nx.kamada_kawai_layout(G, weight="weight")
+            pos = nx.kamada_kawai_layout(G, weight="weight")
         else:
             # Default to force-directed spring layout
-            return nx.spring_layout(G, k=2.0, iterations=100, weight="weight", seed=42)
+            pos = nx.spring_layout(G, k=2.0, iterations=iterations, weight="weight", seed=42)
+
+        if cache_key is not None:
+            self._layout_cache[cache_key] = pos
+        return pos
 
-    def _compute_node_colors(self, simulation: Simulation) -> list:
+    def _compute_node_colors(self, simulation: Simulation) -> np.ndarray:
         """Compute node colors based on peer characteristics.
 
         Color encoding:
@@ -194,17 +214,16 @@ class GraphVisualizer:
             simulation: Simulation with peer data
 
         Returns:
-            List of RGB tuples for each node
+            N×3 array of RGB values for each node
         """
-        colors = []
-        for peer in simulation.peers:
-            r = peer.maliciousness
-            g = 1.0 - peer.maliciousness
-            b = 0.3
-            colors.append((r, g, b))
+        m = simulation.peer_soa.maliciousness
+        colors = np.empty((m.size, 3), dtype=np.float32)
+        colors[:, 0] = m
+        colors[:, 1] = 1.0 - m
+        colors[:, 2] = 0.3
         return colors
 
-    def _compute_node_sizes(self, simulation: Simulation) -> list:
+    def _compute_node_sizes(self, simulation: Simulation) -> np.ndarray:
         """Compute node sizes based on global trust scores.
 
         Larger nodes = higher trust scores
@@ -213,26 +232,22 @@ class GraphVisualizer:
             simulation: Simulation with peer data
 
         Returns:
-            List of node sizes
+            Array of node sizes
         """
         base_size = 300
         max_size = 1500
-        sizes = []
 
-        # Get trust score range
-        trust_scores = [peer.global_trust or 0.0 for peer in simulation.peers]
-        min_trust = min(trust_scores) if trust_scores else 0.0
-        max_trust = max(trust_scores) if trust_scores else 1.0
-        trust_range = max_trust - min_trust if max_trust > min_trust else 1.0
+        trust_scores = simulation.peer_soa.global_trust
+        if trust_scores.size == 0:
+            return np.array([])
 
-        for peer in simulation.peers:
-            trust = peer.global_trust or 0.0
-            # Normalize trust to [0, 1]
-            normalized_trust = (trust - min_trust) / trust_range if trust_range > 0 else 0.5
-            # Scale to size range
-            size = base_size + normalized_trust * (max_size - base_size)
-            sizes.append(size)
-        return sizes
+        # Normalize trust to [0, 1], scale to size range
+        trust_range = float(trust_scores.max() - trust_scores.min())
+        if trust_range > 0:
+            normalized_trust = (trust_scores - trust_scores.min()) / trust_range
+        else:
+            normalized_trust = np.full_like(trust_scores, 0.5)
+        return base_size + normalized_trust * (max_size - base_size)
 
     def _compute_edge_widths(self, G: nx.DiGraph) -> list:
         """Compute edge widths based on trust weights.
@@ -245,14 +260,15 @@ class GraphVisualizer:
         """
         base_width = 1.0
         max_width = 5.0
-        widths = []
-
-        for u, v, data in G.edges(data=True):
-            weight = data.get("weight", 0.0)
-            width = base_width + (max_width - base_width) * weight
-            widths.append(width)
 
-        return widths
+        # Extract weights once, then scale in a single vectorized expression
+        weights = np.fromiter(
+            (data.get("weight", 0.0) for _, _, data in G.edges(data=True)),
+            dtype=np.float32,
+            count=G.number_of_edges(),
+        )
+        widths = base_width + (max_width - base_width) * weights
+        return widths.tolist()
 
     def _add_legend(self, ax) -> None:
         """Add legend explaining visual encoding.
@@ -260,10 +276,22 @@ class GraphVisualizer:
         Args:
             ax: Matplotlib axis
         """
+        ax.legend(handles=_legend_elements(), loc="upper left", fontsize=9, framealpha=0.9)
+
+
+# Proxy artists for the legend are identical on every render, so they are
+# built once on first use (not at import, so backend selection stays free)
+_LEGEND_ELEMENTS: tuple | None = None
+
+
+def _legend_elements() -> tuple:
+    """Get the shared legend proxy artists, building them on first call."""
+    global _LEGEND_ELEMENTS
+    if _LEGEND_ELEMENTS is None:
         from matplotlib.lines import Line2D
         from matplotlib.patches import Patch
 
-        legend_elements = [
+        _LEGEND_ELEMENTS = (
             Patch(facecolor=(0.0, 1.0, 0.3), label="Altruistic (low maliciousness)"),
             Patch(facecolor=(1.0, 0.0, 0.3), label="Malicious (high maliciousness)"),
             Line2D(
@@ -286,6 +314,5 @@ class GraphVisualizer:
             ),
             Line2D([0], [0], color="gray", linewidth=3, label="Thick edge = High local trust"),
             Line2D([0], [0], color="gray", linewidth=1, label="Thin edge = Low local trust"),
-        ]
-
-        ax.legend(handles=legend_elements, loc="upper left", fontsize=9, framealpha=0.9)
+        )
+    return _LEGEND_ELEMENTS
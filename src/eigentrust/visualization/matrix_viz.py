@@ -10,6 +10,7 @@ import numpy as np
 
 from eigentrust.domain.simulation import Simulation
 from eigentrust.domain.trust_matrix import TrustMatrix
+from eigentrust.visualization.figure_pool import get_figure
 
 
 class MatrixVisualizer:
@@ -23,12 +24,12 @@ class MatrixVisualizer:
         annotate_threshold: Maximum matrix size for cell annotations
     """
 
-    def __init__(self, colormap: str = "viridis", dpi: int = 300, annotate_threshold: int = 20):
+    def __init__(self, colormap: str = "viridis", dpi: int = 150, annotate_threshold: int = 20):
         """Initialize matrix visualizer.
 
         Args:
             colormap: Name of matplotlib colormap (default: viridis)
-            dpi: Resolution for saved images (default: 300)
+            dpi: Resolution for saved images (default: 150)
             annotate_threshold: Max size for annotations (default: 20)
         """
         self.colormap = colormap
@@ -57,38 +58,43 @@ class MatrixVisualizer:
         trust_matrix = simulation._build_trust_matrix()
         matrix_np = trust_matrix.to_numpy()
 
-        # Get peer display names for axis labels
+        # Get peer display names for axis labels (O(1) lookups via SoA view)
+        soa = simulation.peer_soa
         peer_ids = list(trust_matrix.peer_mapping.keys())
-        peer_labels = [
-            next(p.display_name for p in simulation.peers if p.peer_id == pid) for pid in peer_ids
-        ]
+        peer_labels = [soa.display_names[soa.id_to_index[pid]] for pid in peer_ids]
 
         # Determine if we should annotate
         n = len(peer_labels)
         if show_annotations is None:
             show_annotations = n <= self.annotate_threshold
 
-        # Create figure and axis
-        fig, ax = plt.subplots(figsize=(10, 8))
+        # Get pooled figure and axis
+        fig, ax = get_figure(figsize=(10, 8))
 
-        # Render heatmap
-        im = ax.imshow(
+        # Render heatmap as a single QuadMesh: pcolormesh draws cell borders
+        # natively in C, replacing imshow plus per-cell minor-tick grid lines
+        im = ax.pcolormesh(
             matrix_np,
             cmap=self.colormap,
-            aspect="auto",
             vmin=0.0,
             vmax=1.0,
-            interpolation="nearest",
+            edgecolors="white" if show_annotations else "none",
+            linewidth=0.5 if show_annotations else 0,
         )
+        ax.invert_yaxis()  # Keep row 0 at the top (imshow orientation)
 
         # Add colorbar
-        plt.colorbar(im, ax=ax, label="Local Trust Value")
-
-        # Set axis labels
-        ax.set_xticks(range(n))
-        ax.set_yticks(range(n))
-        ax.set_xticklabels(peer_labels, rotation=45, ha="right")
-        ax.set_yticklabels(peer_labels)
+        fig.colorbar(im, ax=ax, label="Local Trust Value")
+
+        # Set axis labels at cell centers (unreadable beyond ~50 peers;
+        # skip the label artists)
+        if n <= 50:
+            ax.set_xticks(np.arange(n) + 0.5)
+            ax.set_yticks(np.arange(n) + 0.5)
+            ax.set_xticklabels(peer_labels, rotation=45, ha="right")
+            ax.set_yticklabels(peer_labels)
+        else:
+            ax.tick_params(labelbottom=False, labelleft=False)
 
         # Add axis titles
         ax.set_xlabel("Trustee (peer being evaluated)")
@@ -103,36 +109,42 @@ class MatrixVisualizer:
         if show_annotations:
             self._add_annotations(ax, matrix_np, n)
 
-        # Add grid
-        ax.set_xticks(np.arange(n) - 0.5, minor=True)
-        ax.set_yticks(np.arange(n) - 0.5, minor=True)
-        ax.grid(which="minor", color="white", linestyle="-", linewidth=0.5)
-
-        # Save figure
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=self.dpi, bbox_inches="tight")
-        plt.close(fig)
+        # Save figure (pooled; not closed here)
+        fig.tight_layout()
+        fig.savefig(output_path, dpi=self.dpi, pil_kwargs={"compress_level": 1})
 
     def _add_annotations(self, ax, matrix: np.ndarray, n: int) -> None:
         """Add value annotations to matrix cells.
 
+        Near-zero cells are skipped entirely: each annotation is a separate
+        matplotlib Text artist, and artist count dominates draw/savefig cost
+        on sparse matrices.
+
         Args:
             ax: Matplotlib axis
             matrix: Trust matrix as numpy array
             n: Matrix dimension
         """
-        for i in range(n):
-            for j in range(n):
-                value = matrix[i, j]
-
-                # Choose text color based on background darkness
-                # Use white text on dark backgrounds
-                text_color = "white" if value > 0.5 else "black"
-
-                # Format value with 2 decimal places
-                ax.text(
-                    j, i, f"{value:.2f}", ha="center", va="center", color=text_color, fontsize=8
-                )
+        # Vectorized cell selection: only annotate cells with visible values
+        ii, jj = np.nonzero(matrix > 1e-4)
+        values = matrix[ii, jj]
+
+        # Choose text color based on background darkness
+        # Use white text on dark backgrounds
+        colors = np.where(values > 0.5, "white", "black")
+
+        # Format values with 2 decimal places (+0.5 centers text in the
+        # pcolormesh cell)
+        for i, j, value, text_color in zip(ii, jj, values, colors):
+            ax.text(
+                j + 0.5,
+                i + 0.5,
+                f"{value:.2f}",
+                ha="center",
+                va="center",
+                color=text_color,
+                fontsize=8,
+            )
 
     def visualize_from_matrix(
         self,
@@ -158,27 +170,33 @@ class MatrixVisualizer:
         if show_annotations is None:
             show_annotations = n <= self.annotate_threshold
 
-        # Create figure and axis
-        fig, ax = plt.subplots(figsize=(10, 8))
+        # Get pooled figure and axis
+        fig, ax = get_figure(figsize=(10, 8))
 
-        # Render heatmap
-        im = ax.imshow(
+        # Render heatmap as a single QuadMesh: pcolormesh draws cell borders
+        # natively in C, replacing imshow plus per-cell minor-tick grid lines
+        im = ax.pcolormesh(
             matrix_np,
             cmap=self.colormap,
-            aspect="auto",
             vmin=0.0,
             vmax=1.0,
-            interpolation="nearest",
+            edgecolors="white" if show_annotations else "none",
+            linewidth=0.5 if show_annotations else 0,
         )
+        ax.invert_yaxis()  # Keep row 0 at the top (imshow orientation)
 
         # Add colorbar
-        plt.colorbar(im, ax=ax, label="Local Trust Value")
-
-        # Set axis labels
-        ax.set_xticks(range(n))
-        ax.set_yticks(range(n))
-        ax.set_xticklabels(peer_labels, rotation=45, ha="right")
-        ax.set_yticklabels(peer_labels)
+        fig.colorbar(im, ax=ax, label="Local Trust Value")
+
+        # Set axis labels at cell centers (unreadable beyond ~50 peers;
+        # skip the label artists)
+        if n <= 50:
+            ax.set_xticks(np.arange(n) + 0.5)
+            ax.set_yticks(np.arange(n) + 0.5)
+            ax.set_xticklabels(peer_labels, rotation=45, ha="right")
+            ax.set_yticklabels(peer_labels)
+        else:
+            ax.tick_params(labelbottom=False, labelleft=False)
 
         # Add axis titles
         ax.set_xlabel("Trustee (peer being evaluated)")
@@ -193,12 +211,6 @@ class MatrixVisualizer:
         if show_annotations:
             self._add_annotations(ax, matrix_np, n)
 
-        # Add grid
-        ax.set_xticks(np.arange(n) - 0.5, minor=True)
-        ax.set_yticks(np.arange(n) - 0.5, minor=True)
-        ax.grid(which="minor", color="white", linestyle="-", linewidth=0.5)
-
-        # Save figure
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=self.dpi, bbox_inches="tight")
-        plt.close(fig)
+        # Save figure (pooled; not closed here)
+        fig.tight_layout()
+        fig.savefig(output_path, dpi=self.dpi, pil_kwargs={"compress_level": 1})
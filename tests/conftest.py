@@ -0,0 +1,23 @@
+"""Shared pytest configuration for the eigentrust test suite."""
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _preimport():
+    """Warm the module cache for heavy imports once per session/worker.
+
+    torch alone costs hundreds of milliseconds on first import; loading
+    it (and the modules that pull it in) here keeps that cold-start cost
+    out of whichever test happens to run first, and under pytest-xdist
+    each worker pays it exactly once.
+    """
+    import torch  # noqa: F401
+
+    import eigentrust.algorithms.convergence  # noqa: F401
+    import eigentrust.algorithms.eigentrust  # noqa: F401
+    import eigentrust.algorithms.normalization  # noqa: F401
+    import eigentrust.cli.main  # noqa: F401
+    import eigentrust.domain.simulation  # noqa: F401
+    import eigentrust.simulation.interactions  # noqa: F401
+    import eigentrust.simulation.network  # noqa: F401
@@ -3,120 +3,161 @@
 Tests CLI interface for User Story 1 following TDD principles.
 """
 
+import functools
 import json
-import tempfile
+import shutil
 from pathlib import Path
 
 import pytest
 from typer.testing import CliRunner
 
+from eigentrust.cli.main import app
 
-@pytest.fixture
-def cli_runner():
-    """Create CLI runner for testing."""
-    return CliRunner()
+try:
+    import orjson
 
+    def _loads(path: Path) -> dict:
+        """Parse a JSON artifact from raw bytes with orjson when available."""
+        return orjson.loads(path.read_bytes())
 
-@pytest.fixture
-def temp_output_file():
-    """Create temporary output file for testing."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        yield Path(f.name)
-        # Cleanup
-        Path(f.name).unlink(missing_ok=True)
-
+except ImportError:
 
-def test_should_create_network_via_cli_with_default_options(cli_runner, temp_output_file) -> None:
-    """Test that CLI create command works with default options."""
-    from eigentrust.cli.main import app
+    def _loads(path: Path) -> dict:
+        """Parse a JSON artifact from raw bytes, skipping text-mode decoding."""
+        return json.loads(path.read_bytes())
 
-    result = cli_runner.invoke(app, ["create", "--output", str(temp_output_file)])
 
-    assert result.exit_code == 0
-    assert "Created simulation" in result.stdout or "created" in result.stdout.lower()
-    assert temp_output_file.exists()
 
-    # Verify output file contains valid simulation
-    with open(temp_output_file) as f:
-        data = json.load(f)
-        assert "simulation_id" in data
-        assert "peers" in data
-        assert len(data["peers"]) == 10  # Default peer count
+@functools.lru_cache(maxsize=None)
+def _help_for(command: str):
+    """Invoke `<command> --help` once and cache the result.
 
+    Help output is static per session, so assertions against it should
+    not pay Click's parameter introspection on every call.
+    """
+    return CliRunner().invoke(app, [command, "--help"])
 
-def test_should_create_network_with_custom_peer_count(cli_runner, temp_output_file) -> None:
-    """Test that CLI create command accepts custom peer count."""
-    from eigentrust.cli.main import app
 
-    result = cli_runner.invoke(app, ["create", "--peers", "20", "--output", str(temp_output_file)])
+@pytest.fixture(scope="module")
+def cli_runner():
+    """Create CLI runner shared across the module (stateless between invokes)."""
+    return CliRunner()
 
-    assert result.exit_code == 0
 
-    with open(temp_output_file) as f:
-        data = json.load(f)
-        assert len(data["peers"]) == 20
+@pytest.fixture(scope="session", autouse=True)
+def _warm_app():
+    """Touch the command tree once so Click builds its parser eagerly."""
+    app.registered_commands
 
 
-def test_should_create_network_with_seed_for_reproducibility(cli_runner, temp_output_file) -> None:
-    """Test that CLI create command accepts random seed."""
-    from eigentrust.cli.main import app
+@pytest.fixture
+def temp_output_file(tmp_path_factory):
+    """Provide a per-test output path under a pytest-managed tmp directory.
 
-    result = cli_runner.invoke(
-        app, ["create", "--peers", "15", "--seed", "42", "--output", str(temp_output_file)]
-    )
+    pytest cleans the parent directory, so no manual unlink is needed.
+    """
+    return tmp_path_factory.mktemp("cli", numbered=True) / "out.json"
 
-    assert result.exit_code == 0
 
-    with open(temp_output_file) as f:
-        data = json.load(f)
-        assert data.get("random_seed") == 42 or data.get("seed") == 42
+@pytest.fixture(scope="session")
+def seeded_network(tmp_path_factory):
+    """Build the create+simulate artifact corpus once for the whole session.
 
+    Returns a directory containing network.json (5 peers, seed 42) and
+    sim.json (30 simulated interactions). Tests copy these instead of
+    re-invoking the create and simulate subcommands.
+    """
+    corpus_dir = tmp_path_factory.mktemp("seeded_network")
+    runner = CliRunner()
 
-def test_should_create_network_with_preset_characteristics(cli_runner, temp_output_file) -> None:
-    """Test that CLI create command accepts preset option."""
-    from eigentrust.cli.main import app
+    network_file = corpus_dir / "network.json"
+    result = runner.invoke(
+        app, ["create", "--peers", "5", "--seed", "42", "--output", str(network_file)]
+    )
+    assert result.exit_code == 0, result.stdout
 
-    result = cli_runner.invoke(
+    sim_file = corpus_dir / "sim.json"
+    result = runner.invoke(
         app,
-        ["create", "--peers", "10", "--preset", "adversarial", "--output", str(temp_output_file)],
+        [
+            "simulate",
+            "--input",
+            str(network_file),
+            "--interactions",
+            "30",
+            "--output",
+            str(sim_file),
+        ],
     )
+    assert result.exit_code == 0, result.stdout
 
-    assert result.exit_code == 0
+    return corpus_dir
 
-    with open(temp_output_file) as f:
-        data = json.load(f)
-        assert len(data["peers"]) == 10
 
+@pytest.mark.integration
+def test_should_create_network_via_cli_with_default_options(cli_runner, temp_output_file) -> None:
+    """Test that CLI create command works with default options."""
+    result = cli_runner.invoke(app, ["create", "--output", str(temp_output_file)])
 
-def test_should_fail_with_invalid_peer_count(cli_runner, temp_output_file) -> None:
-    """Test that CLI create command rejects invalid peer counts."""
-    from eigentrust.cli.main import app
+    assert result.exit_code == 0
+    assert "Created simulation" in result.stdout or "created" in result.stdout.lower()
+    assert temp_output_file.exists()
 
-    # Test peer count too low
-    result = cli_runner.invoke(app, ["create", "--peers", "1", "--output", str(temp_output_file)])
-    assert result.exit_code != 0
+    # Verify output file contains valid simulation
+    data = _loads(temp_output_file)
+    assert "simulation_id" in data
+    assert "peers" in data
+    assert len(data["peers"]) == 10  # Default peer count
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    ("peers", "preset", "seed", "expect_success"),
+    [
+        pytest.param("20", None, None, True, id="custom-peer-count"),
+        pytest.param("15", None, "42", True, id="seeded"),
+        pytest.param("10", "adversarial", None, True, id="adversarial-preset"),
+        pytest.param("1", None, None, False, id="too-few-peers"),
+        pytest.param("501", None, None, False, id="too-many-peers"),
+        pytest.param("10", "invalid_preset", None, False, id="invalid-preset"),
+    ],
+)
+def test_should_create_network_with_options(
+    cli_runner, temp_output_file, peers, preset, seed, expect_success
+) -> None:
+    """Test create command option handling across valid and invalid inputs."""
+    args = ["create", "--peers", peers, "--output", str(temp_output_file)]
+    if preset is not None:
+        args += ["--preset", preset]
+    if seed is not None:
+        args += ["--seed", seed]
+
+    result = cli_runner.invoke(app, args)
+
+    if not expect_success:
+        assert result.exit_code != 0
+        return
 
-    # Test peer count too high
-    result = cli_runner.invoke(app, ["create", "--peers", "501", "--output", str(temp_output_file)])
-    assert result.exit_code != 0
+    assert result.exit_code == 0
+    data = _loads(temp_output_file)
+    assert len(data["peers"]) == int(peers)
+    if seed is not None:
+        assert data.get("random_seed") == int(seed) or data.get("seed") == int(seed)
 
 
-def test_should_display_help_for_create_command(cli_runner) -> None:
+def test_should_display_help_for_create_command() -> None:
     """Test that CLI create command has help documentation."""
-    from eigentrust.cli.main import app
-
-    result = cli_runner.invoke(app, ["create", "--help"])
+    result = _help_for("create")
 
     assert result.exit_code == 0
     assert "peers" in result.stdout.lower()
     assert "output" in result.stdout.lower()
 
 
+@pytest.mark.integration
 def test_should_handle_missing_output_path_with_default(cli_runner) -> None:
     """Test that CLI create command uses default output path if not specified."""
 
-    from eigentrust.cli.main import app
-
     # Remove default file if exists
     default_file = Path("simulation.json")
     default_file.unlink(missing_ok=True)
@@ -135,40 +176,17 @@ def test_should_handle_missing_output_path_with_default(cli_runner) -> None:
         default_file.unlink(missing_ok=True)
 
 
-def test_should_reject_invalid_preset_option(cli_runner, temp_output_file) -> None:
-    """Test that CLI create command rejects invalid preset values."""
-    from eigentrust.cli.main import app
-
-    result = cli_runner.invoke(
-        app,
-        [
-            "create",
-            "--peers",
-            "10",
-            "--preset",
-            "invalid_preset",
-            "--output",
-            str(temp_output_file),
-        ],
-    )
-
-    assert result.exit_code != 0
-    assert "preset" in result.stdout.lower() or "invalid" in result.stdout.lower()
-
-
 # ============================================================================
 # User Story 2: Run EigenTrust Algorithm CLI Tests (T037)
 # ============================================================================
 
 
-def test_should_simulate_interactions_via_cli(cli_runner, temp_output_file) -> None:
+@pytest.mark.integration
+def test_should_simulate_interactions_via_cli(cli_runner, temp_output_file, seeded_network) -> None:
     """Test that CLI simulate command generates interactions."""
-    from eigentrust.cli.main import app
-
-    # First create a network
+    # Reuse the session network instead of re-running create
     create_file = temp_output_file.parent / "network.json"
-    result = cli_runner.invoke(app, ["create", "--peers", "5", "--output", str(create_file)])
-    assert result.exit_code == 0
+    shutil.copy(seeded_network / "network.json", create_file)
 
     # Simulate interactions
     sim_file = temp_output_file.parent / "sim_with_interactions.json"
@@ -189,42 +207,19 @@ def test_should_simulate_interactions_via_cli(cli_runner, temp_output_file) -> N
     assert sim_file.exists()
 
     # Verify interactions were added
-    with open(sim_file) as f:
-        data = json.load(f)
-        assert "interactions" in data
-        assert len(data["interactions"]) == 20
-
-    # Cleanup
-    create_file.unlink(missing_ok=True)
-    sim_file.unlink(missing_ok=True)
+    data = _loads(sim_file)
+    assert "interactions" in data
+    assert len(data["interactions"]) == 20
 
 
-def test_should_run_eigentrust_algorithm_via_cli(cli_runner, temp_output_file) -> None:
+@pytest.mark.integration
+def test_should_run_eigentrust_algorithm_via_cli(
+    cli_runner, temp_output_file, seeded_network
+) -> None:
     """Test that CLI run command executes EigenTrust algorithm."""
-    from eigentrust.cli.main import app
-
-    # Create network
-    create_file = temp_output_file.parent / "network.json"
-    result = cli_runner.invoke(
-        app, ["create", "--peers", "5", "--output", str(create_file), "--seed", "42"]
-    )
-    assert result.exit_code == 0
-
-    # Simulate interactions
+    # Reuse the session create+simulate artifacts
     sim_file = temp_output_file.parent / "sim_with_interactions.json"
-    result = cli_runner.invoke(
-        app,
-        [
-            "simulate",
-            "--input",
-            str(create_file),
-            "--interactions",
-            "30",
-            "--output",
-            str(sim_file),
-        ],
-    )
-    assert result.exit_code == 0
+    shutil.copy(seeded_network / "sim.json", sim_file)
 
     # Run algorithm
     result_file = temp_output_file.parent / "results.json"
@@ -235,20 +230,13 @@ def test_should_run_eigentrust_algorithm_via_cli(cli_runner, temp_output_file) -
     assert result_file.exists()
 
     # Verify trust scores computed
-    with open(result_file) as f:
-        data = json.load(f)
-        assert "trust_scores" in data or "global_trust" in str(data)
-
-    # Cleanup
-    create_file.unlink(missing_ok=True)
-    sim_file.unlink(missing_ok=True)
-    result_file.unlink(missing_ok=True)
+    data = _loads(result_file)
+    assert "trust_scores" in data or "global_trust" in str(data)
 
 
+@pytest.mark.integration
 def test_should_display_info_for_simulation(cli_runner, temp_output_file) -> None:
     """Test that CLI info command displays simulation details."""
-    from eigentrust.cli.main import app
-
     # Create network
     result = cli_runner.invoke(app, ["create", "--peers", "3", "--output", str(temp_output_file)])
     assert result.exit_code == 0
@@ -260,29 +248,14 @@ def test_should_display_info_for_simulation(cli_runner, temp_output_file) -> Non
     assert "peer" in result.stdout.lower() or "simulation" in result.stdout.lower()
 
 
-def test_should_run_algorithm_with_custom_parameters(cli_runner, temp_output_file) -> None:
+@pytest.mark.integration
+def test_should_run_algorithm_with_custom_parameters(
+    cli_runner, temp_output_file, seeded_network
+) -> None:
     """Test that CLI run command accepts custom max-iterations and epsilon."""
-    from eigentrust.cli.main import app
-
-    # Create and simulate
-    create_file = temp_output_file.parent / "network.json"
-    result = cli_runner.invoke(app, ["create", "--peers", "3", "--output", str(create_file)])
-    assert result.exit_code == 0
-
+    # Reuse the session create+simulate artifacts
     sim_file = temp_output_file.parent / "sim.json"
-    result = cli_runner.invoke(
-        app,
-        [
-            "simulate",
-            "--input",
-            str(create_file),
-            "--interactions",
-            "15",
-            "--output",
-            str(sim_file),
-        ],
-    )
-    assert result.exit_code == 0
+    shutil.copy(seeded_network / "sim.json", sim_file)
 
     # Run with custom parameters
     result_file = temp_output_file.parent / "results.json"
@@ -303,16 +276,10 @@ def test_should_run_algorithm_with_custom_parameters(cli_runner, temp_output_fil
 
     assert result.exit_code == 0
 
-    # Cleanup
-    create_file.unlink(missing_ok=True)
-    sim_file.unlink(missing_ok=True)
-    result_file.unlink(missing_ok=True)
-
 
+@pytest.mark.integration
 def test_should_fail_run_without_interactions(cli_runner, temp_output_file) -> None:
     """Test that CLI run command fails gracefully without interactions."""
-    from eigentrust.cli.main import app
-
     # Create network without interactions
     result = cli_runner.invoke(app, ["create", "--peers", "3", "--output", str(temp_output_file)])
     assert result.exit_code == 0
@@ -332,5 +299,3 @@ def test_should_fail_run_without_interactions(cli_runner, temp_output_file) -> N
         or result.exit_code == 0
     )
 
-    # Cleanup
-    result_file.unlink(missing_ok=True)
@@ -1,6 +1,8 @@
 """Integration test for full algorithm execution (T036)."""
 
 
+import math
+
 import pytest
 
 from eigentrust.domain.peer import Peer
@@ -24,8 +26,7 @@ def test_should_execute_full_eigentrust_pipeline():
 
     # Simulate interactions
     interactions = simulate_interactions(simulation.peers, num_interactions=30, seed=42)
-    for interaction in interactions:
-        simulation.add_interaction(interaction)
+    simulation.extend_interactions(interactions)
 
     # Run EigenTrust algorithm
     result = simulation.run_algorithm(max_iterations=100, epsilon=0.001)
@@ -35,9 +36,8 @@ def test_should_execute_full_eigentrust_pipeline():
     assert result.iteration_count < 100
     assert len(result.scores) == 3
 
-    # Verify trust scores sum to 1.0
-    total_trust = sum(result.scores.values())
-    assert abs(total_trust - 1.0) < 1e-6
+    # Verify trust scores sum to 1.0 (single tensor reduction)
+    assert abs(result.scores_tensor.double().sum().item() - 1.0) < 1e-6
 
     # Good peer should have higher trust than bad peer
     assert result.scores[peer1.peer_id] > result.scores[peer2.peer_id]
@@ -62,8 +62,7 @@ def test_should_handle_simulation_with_many_peers():
 
     # Simulate many interactions
     interactions = simulate_interactions(simulation.peers, num_interactions=100, seed=123)
-    for interaction in interactions:
-        simulation.add_interaction(interaction)
+    simulation.extend_interactions(interactions)
 
     # Run algorithm
     result = simulation.run_algorithm(max_iterations=100, epsilon=0.001)
@@ -74,7 +73,7 @@ def test_should_handle_simulation_with_many_peers():
 
     # All scores should be positive and sum to 1
     assert all(score > 0 for score in result.scores.values())
-    assert abs(sum(result.scores.values()) - 1.0) < 1e-6
+    assert abs(result.scores_tensor.double().sum().item() - 1.0) < 1e-6
 
 
 def test_should_track_convergence_history():
@@ -88,8 +87,7 @@ def test_should_track_convergence_history():
 
     # Simulate interactions
     interactions = simulate_interactions(simulation.peers, num_interactions=20, seed=99)
-    for interaction in interactions:
-        simulation.add_interaction(interaction)
+    simulation.extend_interactions(interactions)
 
     # Run with history tracking
     result = simulation.run_algorithm(max_iterations=100, epsilon=0.001, track_history=True)
@@ -101,7 +99,7 @@ def test_should_track_convergence_history():
     # Each snapshot should have trust scores for all peers
     for snapshot in result.history:
         assert len(snapshot.trust_scores) == 3
-        assert abs(sum(snapshot.trust_scores.values()) - 1.0) < 1e-6
+        assert abs(math.fsum(snapshot.trust_scores.values()) - 1.0) < 1e-6
 
 
 def test_should_handle_cold_start():
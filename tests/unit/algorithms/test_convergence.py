@@ -5,6 +5,11 @@ import torch
 
 from eigentrust.algorithms.convergence import check_convergence
 
+# Shared inputs for the norm-delta tests, built once: tensor construction
+# dwarfs the 3-element arithmetic these tests actually measure
+_T_OLD = torch.tensor([0.2, 0.3, 0.5], dtype=torch.float32)
+_T_NEW = torch.tensor([0.25, 0.35, 0.4], dtype=torch.float32)
+
 
 def test_should_detect_convergence_when_delta_below_epsilon():
     """Test that convergence is detected when change is below threshold."""
@@ -32,15 +37,12 @@ def test_should_not_converge_when_delta_above_epsilon():
 
 def test_should_compute_l1_norm_delta():
     """Test that delta is computed as L1 norm of difference."""
-    t_old = torch.tensor([0.2, 0.3, 0.5], dtype=torch.float32)
-    t_new = torch.tensor([0.25, 0.35, 0.4], dtype=torch.float32)
     epsilon = 0.5
 
-    status = check_convergence(t_old, t_new, epsilon)
+    status = check_convergence(_T_OLD, _T_NEW, epsilon)
 
     # L1 norm = |0.25-0.2| + |0.35-0.3| + |0.4-0.5| = 0.05 + 0.05 + 0.1 = 0.2
-    expected_delta = 0.2
-    assert abs(status.delta - expected_delta) < 1e-6
+    assert status.delta == pytest.approx(0.2, abs=1e-6)
 
 
 def test_should_handle_identical_vectors():
@@ -56,15 +58,12 @@ def test_should_handle_identical_vectors():
 
 def test_should_use_l2_norm_if_specified():
     """Test that delta can be computed using L2 norm."""
-    t_old = torch.tensor([0.2, 0.3, 0.5], dtype=torch.float32)
-    t_new = torch.tensor([0.25, 0.35, 0.4], dtype=torch.float32)
     epsilon = 0.5
 
-    status = check_convergence(t_old, t_new, epsilon, norm_type="l2")
+    status = check_convergence(_T_OLD, _T_NEW, epsilon, norm_type="l2")
 
     # L2 norm = sqrt((0.05)^2 + (0.05)^2 + (0.1)^2) = sqrt(0.0125) ≈ 0.1118
-    expected_delta = 0.1118
-    assert abs(status.delta - expected_delta) < 0.001
+    assert status.delta == pytest.approx(0.1118, abs=0.001)
 
 
 def test_should_reject_vectors_of_different_sizes():
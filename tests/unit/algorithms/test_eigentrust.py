@@ -1,5 +1,6 @@
 """Unit tests for EigenTrust power iteration (T033)."""
 
+import pytest
 import torch
 
 from eigentrust.algorithms.eigentrust import compute_eigentrust
@@ -20,7 +21,7 @@ def test_should_converge_for_simple_network():
 
     assert converged is True
     assert iterations < 100
-    assert torch.allclose(global_trust.sum(), torch.tensor(1.0), atol=1e-6)
+    assert global_trust.sum().item() == pytest.approx(1.0, abs=1e-6)
     assert all(score >= 0.0 for score in global_trust)
 
 
@@ -36,7 +37,7 @@ def test_should_return_trust_scores_summing_to_one():
         trust_matrix=trust_matrix, pre_trust=pre_trust, max_iterations=100, epsilon=0.001
     )
 
-    assert torch.allclose(global_trust.sum(), torch.tensor(1.0), atol=1e-6)
+    assert global_trust.sum().item() == pytest.approx(1.0, abs=1e-6)
 
 
 def test_should_assign_higher_trust_to_well_connected_peers():
@@ -14,7 +14,7 @@ def test_should_normalize_matrix_columns_to_sum_one():
 
     # Check that each column sums to 1.0
     column_sums = normalized.sum(dim=0)
-    assert torch.allclose(column_sums, torch.ones(3), atol=1e-6)
+    assert (column_sums - 1.0).abs().max().item() < 1e-6
 
 
 def test_should_handle_zero_columns():
@@ -24,8 +24,8 @@ def test_should_handle_zero_columns():
     normalized = normalize_columns(matrix)
 
     # First and third columns should be normalized
-    assert torch.allclose(normalized[:, 0].sum(), torch.tensor(1.0), atol=1e-6)
-    assert torch.allclose(normalized[:, 2].sum(), torch.tensor(1.0), atol=1e-6)
+    assert normalized[:, 0].sum().item() == pytest.approx(1.0, abs=1e-6)
+    assert normalized[:, 2].sum().item() == pytest.approx(1.0, abs=1e-6)
 
     # Second column (all zeros) should remain zero or be uniform
     # (depends on implementation choice for cold start)
@@ -51,7 +51,7 @@ def test_should_handle_already_normalized_matrix():
 
     normalized = normalize_columns(matrix)
 
-    assert torch.allclose(normalized, matrix, atol=1e-6)
+    assert (normalized - matrix).abs().max().item() < 1e-6
 
 
 def test_should_raise_error_for_negative_values():
@@ -1,80 +1,105 @@
 """Unit tests for TrustMatrix entity (T031)."""
 
+import importlib.util
 from uuid import uuid4
 
+import numpy as np
 import pytest
-import torch
 
 from eigentrust.domain.trust_matrix import TrustMatrix
 
+# TrustMatrix clones its input, so module-scoped arrays and IDs can be
+# shared across tests. NumPy construction keeps these tiny fixtures off
+# the torch tensor path; a single guarded test covers torch input.
 
-def test_should_create_trust_matrix_from_tensor():
-    """Test that TrustMatrix can be created with valid tensor."""
-    peer_ids = [uuid4() for _ in range(3)]
-    matrix = torch.tensor([[0.0, 0.5, 0.5], [0.3, 0.0, 0.7], [0.4, 0.6, 0.0]])
 
+@pytest.fixture(scope="module")
+def canonical_3x3():
+    """Canonical 3×3 trust matrix shared by read-only tests."""
+    return np.array(
+        [[0.0, 0.6, 0.4], [0.3, 0.0, 0.7], [0.5, 0.5, 0.0]], dtype=np.float32
+    )
+
+
+@pytest.fixture(scope="module")
+def zeros_2x2():
+    """Empty 2×2 matrix for set_trust tests."""
+    return np.zeros((2, 2), dtype=np.float32)
+
+
+@pytest.fixture(scope="module")
+def peer_ids():
+    """Three peer IDs shared across tests."""
+    return [uuid4() for _ in range(3)]
+
+
+def test_should_create_trust_matrix_from_tensor(canonical_3x3, peer_ids):
+    """Test that TrustMatrix can be created with valid matrix input."""
     trust_matrix = TrustMatrix(
-        matrix=matrix, peer_mapping={peer_ids[0]: 0, peer_ids[1]: 1, peer_ids[2]: 2}
+        matrix=canonical_3x3, peer_mapping=dict(zip(peer_ids, range(3)))
     )
 
     assert trust_matrix.matrix.shape == (3, 3)
     assert len(trust_matrix.peer_mapping) == 3
 
 
-def test_should_reject_non_square_matrix():
+@pytest.mark.skipif(importlib.util.find_spec("torch") is None, reason="torch not installed")
+def test_should_accept_torch_tensor_input(peer_ids):
+    """Test that TrustMatrix still accepts a torch tensor directly."""
+    import torch
+
+    matrix = torch.tensor([[0.0, 0.5], [0.5, 0.0]], dtype=torch.float32)
+
+    trust_matrix = TrustMatrix(matrix=matrix, peer_mapping=dict(zip(peer_ids[:2], range(2))))
+
+    assert trust_matrix.matrix.shape == (2, 2)
+    assert trust_matrix.get_trust(peer_ids[0], peer_ids[1]) == 0.5
+
+
+def test_should_reject_non_square_matrix(peer_ids):
     """Test that TrustMatrix rejects non-square matrices."""
-    peer_ids = [uuid4() for _ in range(2)]
-    matrix = torch.tensor([[0.0, 0.5], [0.3, 0.7], [0.4, 0.6]])
+    matrix = np.array([[0.0, 0.5], [0.3, 0.7], [0.4, 0.6]], dtype=np.float32)
 
     with pytest.raises(ValueError, match="must be square"):
-        TrustMatrix(matrix=matrix, peer_mapping={peer_ids[0]: 0, peer_ids[1]: 1})
+        TrustMatrix(matrix=matrix, peer_mapping=dict(zip(peer_ids[:2], range(2))))
 
 
-def test_should_reject_negative_values():
+def test_should_reject_negative_values(peer_ids):
     """Test that TrustMatrix rejects negative trust values."""
-    peer_ids = [uuid4() for _ in range(2)]
-    matrix = torch.tensor([[0.0, -0.5], [0.3, 0.0]])
+    matrix = np.array([[0.0, -0.5], [0.3, 0.0]], dtype=np.float32)
 
     with pytest.raises(ValueError, match="non-negative"):
-        TrustMatrix(matrix=matrix, peer_mapping={peer_ids[0]: 0, peer_ids[1]: 1})
+        TrustMatrix(matrix=matrix, peer_mapping=dict(zip(peer_ids[:2], range(2))))
 
 
-def test_should_get_trust_value_between_peers():
+def test_should_get_trust_value_between_peers(canonical_3x3, peer_ids):
     """Test getting trust value between two peers."""
-    peer1 = uuid4()
-    peer2 = uuid4()
-    peer3 = uuid4()
-
-    matrix = torch.tensor([[0.0, 0.6, 0.4], [0.3, 0.0, 0.7], [0.5, 0.5, 0.0]])
+    peer1, peer2, peer3 = peer_ids
 
-    trust_matrix = TrustMatrix(matrix=matrix, peer_mapping={peer1: 0, peer2: 1, peer3: 2})
+    trust_matrix = TrustMatrix(matrix=canonical_3x3, peer_mapping=dict(zip(peer_ids, range(3))))
 
     # Peer 1 trusts Peer 2 with 0.6
-    assert trust_matrix.get_trust(peer1, peer2) == pytest.approx(0.6)
+    assert trust_matrix.get_trust(peer1, peer2) == pytest.approx(0.6, abs=1e-7)
     # Peer 2 trusts Peer 3 with 0.7
-    assert trust_matrix.get_trust(peer2, peer3) == pytest.approx(0.7)
+    assert trust_matrix.get_trust(peer2, peer3) == pytest.approx(0.7, abs=1e-7)
 
 
-def test_should_set_trust_value_between_peers():
+def test_should_set_trust_value_between_peers(zeros_2x2, peer_ids):
     """Test setting trust value between two peers."""
-    peer1 = uuid4()
-    peer2 = uuid4()
+    peer1, peer2 = peer_ids[:2]
 
-    matrix = torch.zeros(2, 2)
-    trust_matrix = TrustMatrix(matrix=matrix, peer_mapping={peer1: 0, peer2: 1})
+    trust_matrix = TrustMatrix(matrix=zeros_2x2, peer_mapping=dict(zip(peer_ids[:2], range(2))))
 
     trust_matrix.set_trust(peer1, peer2, 0.8)
 
-    assert trust_matrix.get_trust(peer1, peer2) == pytest.approx(0.8)
+    assert trust_matrix.get_trust(peer1, peer2) == pytest.approx(0.8, abs=1e-7)
 
 
-def test_should_reject_trust_value_out_of_range():
+def test_should_reject_trust_value_out_of_range(zeros_2x2, peer_ids):
     """Test that setting trust value outside [0,1] raises error."""
-    peer1 = uuid4()
-    peer2 = uuid4()
+    peer1, peer2 = peer_ids[:2]
 
-    matrix = torch.zeros(2, 2)
-    trust_matrix = TrustMatrix(matrix=matrix, peer_mapping={peer1: 0, peer2: 1})
+    trust_matrix = TrustMatrix(matrix=zeros_2x2, peer_mapping=dict(zip(peer_ids[:2], range(2))))
 
     with pytest.raises(ValueError, match="must be in range"):
         trust_matrix.set_trust(peer1, peer2, 1.5)
@@ -83,14 +108,14 @@ def test_should_reject_trust_value_out_of_range():
         trust_matrix.set_trust(peer1, peer2, -0.1)
 
 
-def test_should_export_to_numpy():
+def test_should_export_to_numpy(peer_ids):
     """Test exporting matrix to NumPy array."""
-    peer_ids = [uuid4() for _ in range(2)]
-    matrix = torch.tensor([[0.0, 0.5], [0.5, 0.0]])
+    matrix = np.array([[0.0, 0.5], [0.5, 0.0]], dtype=np.float32)
 
-    trust_matrix = TrustMatrix(matrix=matrix, peer_mapping={peer_ids[0]: 0, peer_ids[1]: 1})
+    trust_matrix = TrustMatrix(matrix=matrix, peer_mapping=dict(zip(peer_ids[:2], range(2))))
 
     numpy_matrix = trust_matrix.to_numpy()
 
     assert numpy_matrix.shape == (2, 2)
-    assert numpy_matrix[0, 1] == pytest.approx(0.5)
+    assert numpy_matrix[0, 1] == 0.5
+    assert numpy_matrix.flags["C_CONTIGUOUS"]
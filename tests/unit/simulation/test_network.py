@@ -5,20 +5,23 @@ Tests peer network initialization and configuration following TDD principles.
 
 import pytest
 
+from eigentrust.domain import InsufficientPeersError, InvalidPeerCharacteristics
+from eigentrust.simulation.network import create_network
 
-def test_should_create_network_with_specified_peer_count() -> None:
-    """Test that network creation generates correct number of peers."""
-    from eigentrust.simulation.network import create_network
 
-    sim = create_network(peer_count=10)
+@pytest.fixture(scope="session")
+def default_network():
+    """Default 10-peer network shared by read-only tests."""
+    return create_network(peer_count=10)
 
-    assert len(sim.peers) == 10
+
+def test_should_create_network_with_specified_peer_count(default_network) -> None:
+    """Test that network creation generates correct number of peers."""
+    assert len(default_network.peers) == 10
 
 
 def test_should_create_network_with_random_characteristics() -> None:
     """Test that random preset assigns random characteristics to peers."""
-    from eigentrust.simulation.network import create_network
-
     sim = create_network(peer_count=20, preset="random", seed=42)
 
     assert len(sim.peers) == 20
@@ -35,8 +38,6 @@ def test_should_create_network_with_random_characteristics() -> None:
 
 def test_should_create_network_with_uniform_characteristics() -> None:
     """Test that uniform preset assigns [0.5, 0.5] to all peers."""
-    from eigentrust.simulation.network import create_network
-
     sim = create_network(peer_count=10, preset="uniform")
 
     assert len(sim.peers) == 10
@@ -49,8 +50,6 @@ def test_should_create_network_with_uniform_characteristics() -> None:
 
 def test_should_create_network_with_adversarial_mix() -> None:
     """Test that adversarial preset creates mix of good and bad peers."""
-    from eigentrust.simulation.network import create_network
-
     sim = create_network(peer_count=30, preset="adversarial", seed=123)
 
     assert len(sim.peers) == 30
@@ -66,8 +65,6 @@ def test_should_create_network_with_adversarial_mix() -> None:
 
 def test_should_use_random_seed_for_reproducibility() -> None:
     """Test that same seed produces identical networks."""
-    from eigentrust.simulation.network import create_network
-
     sim1 = create_network(peer_count=15, preset="random", seed=42)
     sim2 = create_network(peer_count=15, preset="random", seed=42)
 
@@ -81,9 +78,6 @@ def test_should_use_random_seed_for_reproducibility() -> None:
 
 def test_should_validate_minimum_peer_count() -> None:
     """Test that network creation requires at least 2 peers."""
-    from eigentrust.domain import InsufficientPeersError
-    from eigentrust.simulation.network import create_network
-
     # Should raise error for 0 peers
     with pytest.raises(InsufficientPeersError):
         create_network(peer_count=0)
@@ -99,9 +93,6 @@ def test_should_validate_minimum_peer_count() -> None:
 
 def test_should_validate_maximum_peer_count() -> None:
     """Test that network creation enforces maximum peer count (500)."""
-    from eigentrust.domain import InvalidPeerCharacteristics
-    from eigentrust.simulation.network import create_network
-
     # Should raise error for >500 peers
     with pytest.raises((InvalidPeerCharacteristics, ValueError)) as exc_info:
         create_network(peer_count=501)
@@ -109,13 +100,9 @@ def test_should_validate_maximum_peer_count() -> None:
     assert "500" in str(exc_info.value) or "maximum" in str(exc_info.value).lower()
 
 
-def test_should_assign_unique_display_names_to_peers() -> None:
+def test_should_assign_unique_display_names_to_peers(default_network) -> None:
     """Test that peers get unique, readable display names."""
-    from eigentrust.simulation.network import create_network
-
-    sim = create_network(peer_count=10)
-
-    display_names = [p.display_name for p in sim.peers]
+    display_names = [p.display_name for p in default_network.peers]
 
     # All should be non-empty
     assert all(len(name) > 0 for name in display_names)
@@ -129,8 +116,6 @@ def test_should_assign_unique_display_names_to_peers() -> None:
 
 def test_should_handle_invalid_preset_gracefully() -> None:
     """Test that invalid preset raises appropriate error."""
-    from eigentrust.simulation.network import create_network
-
     with pytest.raises(ValueError) as exc_info:
         create_network(peer_count=10, preset="invalid_preset")
 